@@ -142,9 +142,39 @@ class Settings(BaseSettings):
     theme_generation_retry_delay_seconds: float = Field(
         default=0.0,
         alias="THEME_GENERATION_RETRY_DELAY_SECONDS",
-        description="Delay in seconds between theme generation retries.",
+        description="Base delay in seconds between theme generation retries (doubled per attempt, with jitter).",
         ge=0.0,
     )
+    theme_generation_parallel_attempts: int = Field(
+        default=1,
+        alias="THEME_GENERATION_PARALLEL_ATTEMPTS",
+        description="Concurrent 5-7-5 attempts per round for OpenAI/Claude theme generation (1 = sequential).",
+        ge=1,
+        le=8,
+    )
+    theme_generation_hedge_delay_seconds: float = Field(
+        default=0.0,
+        alias="THEME_GENERATION_HEDGE_DELAY_SECONDS",
+        description="Seconds to wait on the first parallel attempt before firing the rest (0 = fire all at once).",
+        ge=0.0,
+    )
+    theme_generation_stream_responses: bool = Field(
+        default=False,
+        alias="THEME_GENERATION_STREAM_RESPONSES",
+        description="Stream OpenAI/Claude theme completions and abort an attempt as soon as a line misses 5-7-5.",
+    )
+    theme_generation_category_workers: int = Field(
+        default=1,
+        alias="THEME_GENERATION_CATEGORY_WORKERS",
+        description="Categories generated concurrently by generate_all_categories (1 = one after another).",
+        ge=1,
+        le=8,
+    )
+    theme_generation_batch_categories: bool = Field(
+        default=False,
+        alias="THEME_GENERATION_BATCH_CATEGORIES",
+        description="Ask batch-capable theme clients for all pending categories in one request before per-category retries.",
+    )
     theme_ai_provider: str = Field(
         default="plamo",
         alias="THEME_AI_PROVIDER",
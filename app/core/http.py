@@ -0,0 +1,55 @@
+"""Shared HTTP session for outbound AI provider calls."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app.core.config import get_settings
+
+HTTP_CONNECT_RETRIES = 2
+# Connections kept per provider host even when theme generation runs sequentially
+HTTP_POOL_MIN_SIZE = 8
+
+
+@lru_cache(maxsize=1)
+def _create_session() -> requests.Session:
+    """Build a pooled session so retries and later calls reuse TLS connections.
+
+    urllib3 only retries failed connects here: the POST never reached the
+    provider, so repeating it is safe. Status-based retries stay with the
+    callers, which honour the providers' rate-limit headers.
+    """
+
+    retry = Retry(
+        total=HTTP_CONNECT_RETRIES,
+        connect=HTTP_CONNECT_RETRIES,
+        read=0,
+        status=0,
+        other=0,
+        backoff_factor=0.5,
+        raise_on_status=False,
+    )
+    # Theme generation can have category workers x parallel attempts requests
+    # in flight against one provider; size the pool so none are discarded.
+    settings = get_settings()
+    concurrent_requests = (
+        settings.theme_generation_category_workers * settings.theme_generation_parallel_attempts
+    )
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=max(HTTP_POOL_MIN_SIZE, concurrent_requests),
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
+def get_http_session() -> requests.Session:
+    """Return the process-wide pooled session shared by the AI clients."""
+
+    return _create_session()
@@ -4,13 +4,14 @@ from __future__ import annotations
 
 import io
 import logging
+import threading
 import uuid
 from pathlib import Path
 
 import boto3
 from botocore.exceptions import ClientError
 from fastapi import HTTPException, status
-from PIL import Image
+from PIL import Image, features
 
 from app.core.config import get_settings
 
@@ -23,6 +24,44 @@ MAX_AVATAR_SIZE_BYTES = 5 * 1024 * 1024
 ALLOWED_AVATAR_MIME_TYPES = {"image/jpeg", "image/jpg", "image/png", "image/webp"}
 # Avatar will be resized to this maximum dimension
 AVATAR_MAX_DIMENSION = 256
+# Background colour used when flattening transparent avatars to JPEG
+AVATAR_BACKGROUND_COLOR = (255, 255, 255)
+
+# Per-thread RGB canvas reused when flattening RGBA avatars
+_rgb_scratch = threading.local()
+
+
+def _flatten_onto_white(img: Image.Image) -> Image.Image:
+    """Composite an RGBA image onto a reusable white RGB canvas.
+
+    The canvas is cached per thread and only reallocated when the size
+    changes, so repeated uploads avoid allocating a fresh RGB image.
+    """
+    scratch: Image.Image | None = getattr(_rgb_scratch, "canvas", None)
+    if scratch is None or scratch.size != img.size:
+        scratch = Image.new("RGB", img.size, AVATAR_BACKGROUND_COLOR)
+        _rgb_scratch.canvas = scratch
+    else:
+        scratch.paste(AVATAR_BACKGROUND_COLOR, (0, 0, *img.size))
+    scratch.paste(img, mask=img.getchannel("A"))
+    return scratch
+
+
+def _log_jpeg_capabilities() -> None:
+    """Log the JPEG codec Pillow is linked against.
+
+    Avatar encoding is roughly twice as fast with libjpeg-turbo; a base image
+    change that falls back to plain libjpeg would otherwise go unnoticed.
+    """
+    jpeg_version = features.version("jpg")
+    if not features.check_feature("libjpeg_turbo"):
+        logger.warning(
+            f"[StorageService] Pillow is not using libjpeg-turbo (libjpeg {jpeg_version}); "
+            f"avatar JPEG encoding will be noticeably slower"
+        )
+        return
+    turbo_version = features.version_feature("libjpeg_turbo")
+    logger.info(f"[StorageService] JPEG codec: libjpeg-turbo {turbo_version} (libjpeg API {jpeg_version})")
 
 
 class StorageService:
@@ -33,6 +72,7 @@ class StorageService:
         logger.info(f"[StorageService] Initializing with r2_account_id={settings.r2_account_id}")
         logger.info(f"[StorageService] r2_bucket_name={settings.r2_bucket_name}")
         logger.info(f"[StorageService] r2_public_url={settings.r2_public_url!r}")
+        _log_jpeg_capabilities()
 
         # Local upload directory (used as fallback in development)
         self._local_upload_dir = Path(settings.local_upload_dir) / "avatars"
@@ -166,16 +206,21 @@ class StorageService:
         """
         try:
             with Image.open(io.BytesIO(file_content)) as img:
-                # Convert to RGB (in case of PNG with alpha)
-                if img.mode in ("RGBA", "P"):
+                # Palette images need expanding before they can be encoded as JPEG
+                if img.mode == "P":
                     img = img.convert("RGB")
 
                 # Resize maintaining aspect ratio
                 img.thumbnail((AVATAR_MAX_DIMENSION, AVATAR_MAX_DIMENSION), Image.Resampling.LANCZOS)
 
-                # Save as JPEG
+                # Flatten alpha onto white after resizing so the canvas stays small
+                if img.mode == "RGBA":
+                    img = _flatten_onto_white(img)
+
+                # Save as JPEG (single-pass encode; Huffman optimisation saves
+                # well under 1KB at this size but costs a second pass)
                 output = io.BytesIO()
-                img.save(output, format="JPEG", quality=85, optimize=True)
+                img.save(output, format="JPEG", quality=85)
                 return output.getvalue()
 
         except Exception as e:
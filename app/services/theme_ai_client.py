@@ -3,24 +3,59 @@
 from __future__ import annotations
 
 import json
+import logging
+import random
 import re
-from dataclasses import dataclass
-from datetime import date
-from typing import Any, Protocol, Sequence
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Iterator, Mapping, Protocol, Sequence
 
 import anthropic
+import orjson
 import requests
 from pykakasi import kakasi
 
 from app.core.config import get_settings
+from app.core.http import get_http_session
 from app.core.logging import logger
 
 
 def get_season_info(target_date: date) -> str:
     """Get Japanese season name and description based on date."""
-    month = target_date.month
-    day = target_date.day
+    return _season_info(target_date.month, target_date.day)
 
+
+def _fill_season_info(template: str, target_date: date) -> str:
+    """Insert the season description into a category prompt that asks for it.
+
+    Only the 季節 prompts carry a ``{season_info}`` placeholder, so the other
+    categories are returned verbatim without formatting.
+    """
+    if "{season_info}" not in template:
+        return template
+    return _format_season_prompt(template, get_season_info(target_date))
+
+
+@lru_cache(maxsize=64)
+def _format_season_prompt(template: str, season_info: str) -> str:
+    # Keyed on the season text, so each template has only ~16 distinct results
+    return template.format(season_info=season_info)
+
+
+def _category_instruction(prompts: Mapping[str, str], category: str, target_date: date) -> str:
+    """Return the category's prompt (or the generic fallback) with the season filled in."""
+    template = prompts.get(category, f"「{category}」というテーマで現代的な表現を使ってください。")
+    return _fill_season_info(template, target_date)
+
+
+@lru_cache(maxsize=None)
+def _season_info(month: int, day: int) -> str:
+    # Keyed on (month, day) so every year shares at most 366 entries
     # 具体的な現代の季節キーワード（「師走」「睦月」などの古語は避け、映像重視）
     if month == 1:
         if day == 1:
@@ -87,10 +122,117 @@ class ThemeAIClientError(RuntimeError):
     """Raised when an AI client cannot produce a valid theme."""
 
 
+# Transient provider failures worth waiting out (529 = Anthropic overloaded)
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504, 529})
+HTTP_BACKOFF_MAX_RETRIES = 3
+HTTP_BACKOFF_BASE_SECONDS = 1.0
+HTTP_BACKOFF_MAX_SECONDS = 30.0
+
+
+def _server_retry_delay(headers: Any) -> float | None:
+    """Return the wait requested by Retry-After or Anthropic reset headers."""
+    if not headers:
+        return None
+
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                retry_at = None
+            if retry_at is not None:
+                return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    reset = headers.get("anthropic-ratelimit-requests-reset")
+    if reset:
+        try:
+            reset_at = datetime.fromisoformat(reset.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
+
+    return None
+
+
+def _backoff_delay(attempt: int, headers: Any = None) -> float:
+    """Return the wait before retry ``attempt`` (0-based), preferring server hints."""
+    server_delay = _server_retry_delay(headers)
+    if server_delay is not None:
+        return min(HTTP_BACKOFF_MAX_SECONDS, server_delay)
+    delay = min(HTTP_BACKOFF_MAX_SECONDS, HTTP_BACKOFF_BASE_SECONDS * 2**attempt)
+    return delay * (1 + random.uniform(0, 0.5))
+
+
+def _post_with_backoff(url: str, **kwargs: Any) -> requests.Response:
+    """POST via the shared session, backing off on 429/5xx responses.
+
+    Non-retryable responses (including other 4xx) are returned immediately so
+    the caller's ``raise_for_status`` handling stays unchanged.
+    """
+    for attempt in range(HTTP_BACKOFF_MAX_RETRIES + 1):
+        response = get_http_session().post(url, **kwargs)
+        if response.status_code not in RETRYABLE_STATUS_CODES or attempt == HTTP_BACKOFF_MAX_RETRIES:
+            return response
+        delay = _backoff_delay(attempt, getattr(response, "headers", None))
+        # Release the pooled connection (held open for stream=True) before waiting
+        response.close()
+        logger.warning(
+            f"{url} returned {response.status_code}; retrying in {delay:.1f}s "
+            f"({attempt + 1}/{HTTP_BACKOFF_MAX_RETRIES})"
+        )
+        time.sleep(delay)
+    return response  # pragma: no cover - loop always returns
+
+
+def _iter_attempts(
+    call: Callable[[], str],
+    *,
+    max_attempts: int,
+    parallel: int = 1,
+    hedge_delay: float = 0.0,
+) -> Iterator[str]:
+    """Yield up to ``max_attempts`` results of ``call``.
+
+    With ``parallel`` > 1 the calls are issued in concurrent rounds and yielded
+    in completion order, so the caller can stop at the first valid verse.
+    Requests still in flight when the caller stops are abandoned.
+
+    With ``hedge_delay`` > 0 each round starts with a single request and only
+    fires the extra ones if it is still pending after that many seconds (or
+    came back unusable), so fast rounds cost one request instead of several.
+    """
+    if parallel <= 1:
+        for _ in range(max_attempts):
+            yield call()
+        return
+
+    executor = ThreadPoolExecutor(max_workers=parallel)
+    try:
+        remaining = max_attempts
+        while remaining > 0:
+            batch = min(parallel, remaining)
+            remaining -= batch
+            first = executor.submit(call)
+            if hedge_delay > 0 and wait([first], timeout=hedge_delay).done:
+                yield first.result()
+                futures = [executor.submit(call) for _ in range(batch - 1)]
+            else:
+                futures = [first, *(executor.submit(call) for _ in range(batch - 1))]
+            for future in as_completed(futures):
+                yield future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 XAI_CANDIDATE_SEPARATOR = "---"
 XAI_DISALLOWED_MARKERS = ("候補", "音数", "モーラ", "5-7-5", "説明", "理由")
 XAI_CANDIDATE_PREFIX_PATTERN = re.compile(r"^\s*(?:候補|案)?\s*\d+\s*[:：.\-、)]\s*")
 XAI_CODE_FENCE_PATTERN = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$")
+XAI_CANDIDATE_SPLIT_PATTERN = re.compile(rf"\n\s*{re.escape(XAI_CANDIDATE_SEPARATOR)}\s*\n")
+WHITESPACE_PATTERN = re.compile(r"\s+")
 
 
 @dataclass(slots=True)
@@ -119,7 +261,7 @@ def _strip_code_fence(text: str) -> str:
 
 
 def _normalize_theme_key(text: str) -> str:
-    return re.sub(r"\s+", "", text).strip()
+    return WHITESPACE_PATTERN.sub("", text).strip()
 
 
 def _clean_candidate_block(block: str) -> str:
@@ -140,7 +282,7 @@ def _split_xai_candidates(content: str) -> list[ThemeCandidate]:
     if not cleaned:
         return []
 
-    blocks = re.split(rf"\n\s*{re.escape(XAI_CANDIDATE_SEPARATOR)}\s*\n", cleaned)
+    blocks = XAI_CANDIDATE_SPLIT_PATTERN.split(cleaned)
     candidates: list[ThemeCandidate] = []
     for index, block in enumerate(blocks):
         text = _clean_candidate_block(block)
@@ -184,7 +326,7 @@ def _filter_xai_candidates(
 
 def _select_local_fallback(candidates: Sequence[ThemeCandidate]) -> tuple[ThemeCandidate, list[int]] | None:
     for candidate in candidates:
-        is_valid, counts = validate_575(candidate.text)
+        is_valid, counts, _ = validate_575(candidate.text)
         if is_valid:
             return candidate, counts
     return None
@@ -251,11 +393,10 @@ class OpenAIThemeJudge:
         if not candidates:
             raise ThemeAIClientError("OpenAI judge requires at least one candidate")
 
-        recent_themes = list(past_themes or [])[:30]
         candidate_text = "\n\n".join(
             f"candidate_{candidate.index}:\n{candidate.text}" for candidate in candidates
         )
-        recent_themes_text = "\n".join(f"- {theme.replace(chr(10), ' / ')}" for theme in recent_themes) or "- なし"
+        recent_themes_text = _format_past_theme_list(past_themes or ()) or "- なし"
 
         prompt = (
             "短歌アプリ『よみびより』のお題選定です。"
@@ -326,7 +467,7 @@ class OpenAIThemeJudge:
         }
 
         try:
-            response = requests.post(self.endpoint, json=payload, headers=headers, timeout=self.timeout)
+            response = _post_with_backoff(self.endpoint, json=payload, headers=headers, timeout=self.timeout)
         except requests.RequestException as exc:  # pragma: no cover - network failure path
             raise ThemeAIClientError(f"Failed to call OpenAI judge endpoint: {exc}") from exc
 
@@ -346,7 +487,7 @@ class OpenAIThemeJudge:
             raise ThemeAIClientError(f"OpenAI judge API returned {response.status_code}") from exc
 
         try:
-            payload_json = response.json()
+            payload_json = orjson.loads(response.content)
         except ValueError as exc:
             raise ThemeAIClientError("OpenAI judge API returned invalid JSON") from exc
 
@@ -420,11 +561,10 @@ class GeminiThemeJudge:
         if not candidates:
             raise ThemeAIClientError("Gemini judge requires at least one candidate")
 
-        recent_themes = list(past_themes or [])[:30]
         candidate_text = "\n\n".join(
             f"candidate_{candidate.index}:\n{candidate.text}" for candidate in candidates
         )
-        recent_themes_text = "\n".join(f"- {theme.replace(chr(10), ' / ')}" for theme in recent_themes) or "- なし"
+        recent_themes_text = _format_past_theme_list(past_themes or ()) or "- なし"
 
         prompt = (
             "短歌アプリ『よみびより』のお題選定です。"
@@ -478,7 +618,7 @@ class GeminiThemeJudge:
         }
 
         try:
-            response = requests.post(self.endpoint, json=payload, headers=headers, timeout=self.timeout)
+            response = _post_with_backoff(self.endpoint, json=payload, headers=headers, timeout=self.timeout)
         except requests.RequestException as exc:
             raise ThemeAIClientError(f"Failed to call Gemini judge endpoint: {exc}") from exc
 
@@ -493,7 +633,7 @@ class GeminiThemeJudge:
             raise ThemeAIClientError(f"Gemini judge API returned {response.status_code}: {body}") from exc
 
         try:
-            payload_json = response.json()
+            payload_json = orjson.loads(response.content)
         except ValueError as exc:
             raise ThemeAIClientError("Gemini judge API returned invalid JSON") from exc
 
@@ -535,11 +675,53 @@ class GeminiThemeJudge:
         )
 
 
+# Whitespace and punctuation ignored when counting mora
+SYLLABLE_IGNORED_PATTERN = re.compile(r"[\s\u3000。、！？]")
+# Kana, kanji and half-width katakana: the only characters kakasi yields mora for
+JAPANESE_TEXT_PATTERN = re.compile(r"[\u3040-\u30FF\u3400-\u9FFF\uF900-\uFAFF\uFF66-\uFF9F]")
+# Plain kana and ー, whose mora count kakasi leaves unchanged (iteration marks
+# such as ゝ/ヽ and combining sound marks are excluded on purpose)
+PLAIN_KANA_PATTERN = re.compile(r"[ぁ-ゖァ-ヺー]+")
+MORA_PATTERN_575 = (5, 7, 5)
+# Generous upper bound on a 5-7-5 verse's length: 17 mora are at most ~34
+# kana (each mora is one character or a digraph such as きゃ), and kanji
+# only make lines shorter. The slack covers spaces and punctuation.
+MAX_HAIKU_CHARS = 60
+# Small ya/yu/yo and small vowels combine with the previous character.
+# っ (small tsu) and ー (long vowel) DO count.
+SMALL_KANA = frozenset("ゃゅょぁぃぅぇぉゎャュョァィゥェォヮ")
+
+
+class _MoraKanaTable(dict):
+    """str.translate table keeping only kana that count as one mora each.
+
+    Entries are filled on first lookup instead of covering all of Unicode up
+    front; kakasi output only ever touches a few hundred code points.
+    """
+
+    def __missing__(self, codepoint: int) -> int | None:
+        keep = 0x3040 <= codepoint <= 0x30FF and chr(codepoint) not in SMALL_KANA
+        value = codepoint if keep else None
+        self[codepoint] = value
+        return value
+
+
+MORA_KANA_TABLE = _MoraKanaTable()
+
+
+@lru_cache(maxsize=1)
+def _get_kakasi() -> kakasi:
+    """Return a shared pykakasi converter (dictionary load is expensive)."""
+    return kakasi()
+
+
+@lru_cache(maxsize=4096)
 def count_syllables(text: str) -> int:
     """Count the number of syllables (音数/モーラ) in Japanese text.
 
     Converts kanji to hiragana using pykakasi, then counts mora correctly.
     Small kana (ゃゅょ etc.) combine with previous character and don't count separately.
+    Results are memoized because the same lines recur across retries and candidates.
 
     Args:
         text: Japanese text to count syllables in (can include kanji)
@@ -548,49 +730,184 @@ def count_syllables(text: str) -> int:
         Number of mora (morae count)
     """
     # Remove whitespace and common punctuation
-    text = re.sub(r'[\s\u3000。、！？]', '', text)
+    text = SYLLABLE_IGNORED_PATTERN.sub("", text)
+    if not text:
+        return 0
+
+    # Kana-only lines (e.g. Claude's all-hiragana output) need no conversion
+    if PLAIN_KANA_PATTERN.fullmatch(text):
+        return len(text.translate(MORA_KANA_TABLE))
 
     # Convert kanji to hiragana using pykakasi
-    kks = kakasi()
-    result = kks.convert(text)
+    result = _get_kakasi().convert(text)
     hiragana_text = ''.join([item['hira'] for item in result])
 
-    # Small kana that combine with previous character (don't count as separate mora)
-    small_kana = 'ゃゅょぁぃぅぇぉゎャュョァィゥェォヮ'
+    return len(hiragana_text.translate(MORA_KANA_TABLE))
 
-    # Count mora: all kana except small kana count as 1 mora each
-    # っ (small tsu) and ー (long vowel) DO count as separate mora
-    mora_count = 0
-    for char in hiragana_text:
-        if '\u3040' <= char <= '\u309F' or '\u30A0' <= char <= '\u30FF':
-            # Skip small ya/yu/yo and small vowels (they combine with previous)
-            if char not in small_kana:
-                mora_count += 1
 
-    return mora_count
+def _format_lines_detail(lines: list[str], counts: list[int]) -> str:
+    """Return a "'line' (count) | ..." summary for log messages."""
+    return " | ".join(f"'{line}' ({count})" for line, count in zip(lines, counts))
 
 
-def validate_575(text: str) -> tuple[bool, list[int]]:
+def validate_575(text: str) -> tuple[bool, list[int], list[str]]:
     """Validate that a haiku follows the 5-7-5 syllable pattern.
 
     Args:
         text: Haiku text with lines separated by newlines
 
     Returns:
-        Tuple of (is_valid, syllable_counts)
+        Tuple of (is_valid, syllable_counts, lines)
         - is_valid: True if the haiku is exactly 5-7-5
-        - syllable_counts: List of syllable counts for each line
+        - syllable_counts: Syllable counts for each line, stopping at the
+          first line that misses its target
+        - lines: The stripped text split into lines
     """
     lines = text.strip().split('\n')
 
     # Must have exactly 3 lines
     if len(lines) != 3:
-        return False, []
+        return False, [], lines
 
-    counts = [count_syllables(line) for line in lines]
-    is_valid = counts == [5, 7, 5]
+    # Rambling responses cannot be 5-7-5, so reject them without any kakasi pass
+    if sum(map(len, lines)) > MAX_HAIKU_CHARS:
+        return False, [], lines
 
-    return is_valid, counts
+    counts: list[int] = []
+    for line, target in zip(lines, MORA_PATTERN_575):
+        count = _count_line_mora(line)
+        counts.append(count)
+        if count != target:
+            return False, counts, lines
+
+    return True, counts, lines
+
+
+def _count_line_mora(line: str) -> int:
+    # Lines with no kana/kanji always count as 0 mora, so skip kakasi
+    return count_syllables(line) if JAPANESE_TEXT_PATTERN.search(line) else 0
+
+
+def _read_streamed_verse(deltas: Iterable[str]) -> str:
+    """Accumulate streamed verse text, stopping as soon as the verse is decided.
+
+    Each completed line is checked against its target as soon as its newline
+    arrives. On a miss the partial text is returned right away; it still
+    fails ``validate_575``, so callers treat it like any other invalid
+    attempt. Once three completed lines match 5-7-5 the verse is returned
+    without waiting for whatever the model would add after it.
+    """
+    text = ""
+    checked = 0
+    for delta in deltas:
+        text += delta
+        if "\n" not in delta:
+            continue
+        completed = text.lstrip().split("\n")[:-1]
+        for index in range(checked, min(len(completed), len(MORA_PATTERN_575))):
+            if _count_line_mora(completed[index]) != MORA_PATTERN_575[index]:
+                return text
+        if len(completed) >= len(MORA_PATTERN_575):
+            return "\n".join(completed[: len(MORA_PATTERN_575)])
+        checked = len(completed)
+    return text
+
+
+def _iter_sse_text_deltas(response: requests.Response) -> Iterator[str]:
+    """Yield ``delta.content`` strings from a Chat Completions SSE stream."""
+    for raw_line in response.iter_lines():
+        if not raw_line.startswith(b"data:"):
+            continue
+        data = raw_line[5:].strip()
+        if data == b"[DONE]":
+            return
+        chunk = orjson.loads(data)
+        try:
+            delta = chunk["choices"][0]["delta"].get("content")
+        except (KeyError, IndexError, TypeError, AttributeError):
+            continue
+        if delta:
+            yield delta
+
+
+# Only the most recent past themes go into prompts to keep them short
+PAST_THEMES_PROMPT_LIMIT = 30
+
+
+def _format_past_theme_list(past_themes: Sequence[str]) -> str:
+    """Return the most recent past themes as "- line1 / line2 / line3" bullets."""
+    return "\n".join(f"- {theme.replace(chr(10), ' / ')}" for theme in past_themes[:PAST_THEMES_PROMPT_LIMIT])
+
+
+def _past_themes_instruction(past_themes: Sequence[str] | None) -> str:
+    """Return the "avoid these past themes" prompt section, or "" when there are none."""
+    if not past_themes:
+        return ""
+    return _render_past_themes_instruction(tuple(past_themes[:PAST_THEMES_PROMPT_LIMIT]))
+
+
+@lru_cache(maxsize=16)
+def _render_past_themes_instruction(recent_themes: tuple[str, ...]) -> str:
+    # Cached because the same history is passed to every attempt and fallback client
+    return (
+        "\n\n【重要：過去のお題との重複禁止】\n"
+        "以下は過去に出題されたお題です。これらと同じ・類似のお題は絶対に作らないでください。\n"
+        "新しい視点、新しい言葉の組み合わせで、まだ詠まれていないお題を創作してください。\n"
+        f"{_format_past_theme_list(recent_themes)}"
+    )
+
+
+# Header for the batch prompt; each category section lists its own history
+BATCH_PAST_THEMES_INSTRUCTION = (
+    "\n\n【重要：過去のお題との重複禁止】\n"
+    "各カテゴリーの「過去のお題」と同じ・類似のお題は絶対に作らないでください。\n"
+    "新しい視点、新しい言葉の組み合わせで、まだ詠まれていないお題を創作してください。"
+)
+
+
+def _batch_category_section(category: str, instruction: str, past_themes: Sequence[str] | None) -> str:
+    """Return one category's line in the batch prompt, with its own past themes."""
+    section = f"- {category}: {instruction}\n"
+    if past_themes:
+        history = _format_past_theme_list(past_themes).replace("\n", "\n    ")
+        section += f"  過去のお題:\n    {history}\n"
+    return section
+
+
+def _first_valid_verse(provider: str, attempts: Iterable[str], max_attempts: int) -> str:
+    """Return the first 5-7-5 verse from ``attempts``, logging each miss.
+
+    When every attempt fails, the last one is returned (or ``""`` if there
+    were none) so callers can still fall back on it.
+    """
+    last_content = None
+    last_counts = None
+    for attempt, content in enumerate(attempts, start=1):
+        is_valid, counts, lines = validate_575(content)
+
+        if is_valid:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("[%s] Success on attempt %d: %s", provider, attempt, _format_lines_detail(lines, counts))
+            return content
+
+        # Not valid, log and retry
+        last_content = content
+        last_counts = counts
+        logger.warning(
+            "[%s] Attempt %d/%d failed: expected [5,7,5], got %s", provider, attempt, max_attempts, counts
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[%s] Lines: %s", provider, _format_lines_detail(lines, counts))
+
+    # All retries exhausted, return last attempt with warning
+    logger.error(
+        "[%s] All %d attempts failed. Using last result with syllables %s: %s",
+        provider,
+        max_attempts,
+        last_counts,
+        last_content,
+    )
+    return last_content or ""
 
 
 class ThemeAIClient(Protocol):
@@ -628,6 +945,143 @@ class DummyThemeAIClient(ThemeAIClient):
         return f"{self.prefix} for {category} on {target_date.isoformat()}"
 
 
+# 音数ルールを説明するシステムプロンプト（OpenAI/Claude共通）
+THEME_SYSTEM_PROMPT = (
+    "あなたは音数（モーラ数）に精通した現代的でポップな俳句の「上の句」を作る詩人です。\n"
+    "必ず5-7-5の音数を守り、一音一音数えながら作句します。\n\n"
+    "【重要：音数カウントルール】\n"
+    "以下すべて1音（1モーラ）として数えます：\n"
+    "1. 通常の仮名：「あ」「か」「さ」など → 各1音\n"
+    "2. 促音「っ」 → 1音（例：がっこう=4音）\n"
+    "3. 撥音「ん」 → 1音（例：さんぽ=3音）\n"
+    "4. 長音「ー」 → 1音（例：コーヒー=4音）\n"
+    "5. 拗音「きゃ」「しょ」「ちゅ」 → 各1音\n"
+    "6. 小さい「ゃゅょ」 → 前の文字と合わせて1音\n\n"
+    "注意：文字数≠音数です。音数で数えてください。"
+)
+
+
+@lru_cache(maxsize=32)
+def _render_user_prompt(template: str, category_instruction: str, past_themes_instruction: str) -> str:
+    """Fill a user prompt template, reusing the result for repeated inputs.
+
+    generate_with_retry calls a client several times with the same category,
+    date and past themes, so the multi-KB prompt is only formatted once.
+    """
+    return template.format(
+        category_instruction=category_instruction,
+        past_themes_instruction=past_themes_instruction,
+    )
+
+
+# Few-shot examples with explicit mora counting（OpenAI/Claude共通）
+THEME_FEW_SHOT_MESSAGES: tuple[dict[str, str], ...] = (
+    {"role": "user", "content": "恋愛をテーマに、下の句で完結する5-7-5の上の句を作ってください。音数を数えてから作ってください。"},
+    {"role": "assistant", "content": "すれ違う（す1れ2ち3が4う5）\nいつもの駅で（い1つ2も3の4え5き6で7）\nまた会えた（ま1た2あ3え4た5）"},
+    {"role": "user", "content": "季節をテーマに、下の句で完結する5-7-5の上の句を作ってください。音数を数えてから作ってください。"},
+    {"role": "assistant", "content": "傘なくて（か1さ2な3く4て5）\nにわか雨降る（に1わ2か3あ4め5ふ6る7）\n君と僕（き1み2と3ぼ4く5）"},
+    {"role": "user", "content": "日常をテーマに、下の句で完結する5-7-5の上の句を作ってください。音数を数えてから作ってください。"},
+    {"role": "assistant", "content": "寝過ごして（ね1す2ご3し4て5）\n電車の中で（で1ん2しゃ3の4な5か6で7）\n目が覚める（め1が2さ3め4る5）"},
+)
+
+# System prompt and few-shot turns never change, so build the shared message
+# prefix once; generate() only appends the rendered user prompt.
+OPENAI_STATIC_MESSAGES: tuple[dict[str, str], ...] = (
+    {"role": "system", "content": THEME_SYSTEM_PROMPT},
+    *THEME_FEW_SHOT_MESSAGES,
+)
+
+
+# Verse rules shared by the single-verse and batch OpenAI prompts
+OPENAI_VERSE_RULES = (
+    "【音数の厳守（絶対条件）】\n"
+    "- 1行目：必ず正確に5音（例: す・れ・ち・が・う）\n"
+    "- 2行目：必ず正確に7音（例: い・つ・も・の・え・き・で）\n"
+    "- 3行目：必ず正確に5音（例: ま・た・あ・え・た）\n"
+    "- 音数が合わない句は絶対に出力しないでください\n\n"
+    "【独創性（重要）】\n"
+    "- ありきたりな表現は避ける\n"
+    "- 意外性のある視点や切り口を見つける\n"
+    "- 見慣れた風景に新しい発見をもたらす\n"
+    "- 読んだ人が「なるほど！」と思える表現\n\n"
+    "【示唆に富んだ表現（重要）】\n"
+    "- 単なる事実の羅列ではなく、深い意味を含める\n"
+    "- 読む人の想像力を刺激する言葉選び\n"
+    "- 多義的な解釈ができる余韻を持たせる\n"
+    "- 印象に残る、心に響く表現を目指す\n\n"
+    "【下の句で完結させる】\n"
+    "- 上の句では完結させず、余韻を残す\n"
+    "- 情景描写に留め、感情や結論は下の句に委ねる\n"
+    "- 「〜てる」「〜いる」「〜した」など、続きを想像させる表現\n"
+    "- ユーザーが「続きを詠みたい！」と思える内容\n\n"
+    "【表現スタイル】\n"
+    "- 現代的でポップな言葉を使用\n"
+    "- ひらがな・カタカナ・漢字を自然にミックス\n"
+    "- 情景が目に浮かぶ具体的な表現\n"
+)
+
+
+OPENAI_USER_PROMPT_TEMPLATE = (
+    "以下の条件で、ユーザーが下の句を続けたくなる「上の句」を作成してください。\n"
+    "**作成前に必ず一音ずつ数えて、5-7-5を厳密に確認してください。**\n\n"
+    + OPENAI_VERSE_RULES
+    + "- テーマ: {category_instruction}"
+    "{past_themes_instruction}\n\n"
+    "【出力形式】\n"
+    "- 必ず3行（1行目5音/2行目7音/3行目5音）\n"
+    "- 句のみ出力（音数カウントや説明は不要）\n"
+    "- 例: すれ違う\\nいつもの駅で\\nまた会えた"
+)
+
+
+# 複数カテゴリーを1リクエストでまとめて生成する場合のユーザープロンプト
+OPENAI_BATCH_USER_PROMPT_TEMPLATE = (
+    "以下の各カテゴリーについて、ユーザーが下の句を続けたくなる「上の句」を1つずつ作成してください。\n"
+    "**作成前に必ず一音ずつ数えて、5-7-5を厳密に確認してください。**\n\n"
+    + OPENAI_VERSE_RULES
+    + "\n【カテゴリーとテーマ】\n"
+    "{category_sections}"
+    "{past_themes_instruction}\n\n"
+    "【出力形式】\n"
+    "- 次の形式のJSONオブジェクトのみを出力: "
+    '{{"themes": {{"カテゴリー名": "1行目\\n2行目\\n3行目"}}}}\n'
+    "- 各句は必ず3行（1行目5音/2行目7音/3行目5音）\n"
+    "- 句のみ出力（音数カウントや説明は不要）"
+)
+
+
+# カテゴリー別のプロンプト定義（OpenAI）
+OPENAI_CATEGORY_PROMPTS: Mapping[str, str] = MappingProxyType({
+    "恋愛": (
+        "恋愛・片思い・デート・別れなど、恋にまつわるシーンを表現してください。"
+        "「甘酸っぱい青春」「大人の苦い恋」「運命の出会い」など、"
+        "読んだ人が自分の思い出を重ねたくなるような、エモーショナルな句にしてください。"
+    ),
+    "季節": (
+        "季節感、天気、自然の移り変わりを表現してください。"
+        "単なる風景描写だけでなく、「その季節ならではの匂い・温度・感情」を"
+        "呼び起こすような、五感に訴える表現を目指してください。\n"
+        "【重要】現在の季節: {season_info}"
+    ),
+    "日常": (
+        "通勤・通学、食事、仕事、家事などの日常シーンを切り取ってください。"
+        "「あるある」と共感できる瞬間や、普段見落としがちな小さな幸せ・発見を"
+        "ユニークな視点で表現してください。"
+    ),
+    "ユーモア": (
+        "ユーザーが思わず「下の句」でツッコミを入れたくなるような『大喜利のフリ』となる句を作ってください。"
+        "以下の5つのパターンのいずれかを意識してください:\n"
+        "1. 【自虐・失敗】自分のダメな部分や、日常の悲しい失敗談。\n"
+        "2. 【シュール】現実ではありえない状況設定。\n"
+        "3. 【社会風刺】会社や学校、世の中への皮肉。\n"
+        "4. 【ブラックユーモア】人生の不条理、存在の虚しさ、世代間ギャップ、"
+        "老い、孤独、締切、税金など「笑うしかない現実」を皮肉たっぷりに詠む。"
+        "毒があるが品がある、読んだ人が「わかる…」と苦笑いするような句を目指してください。\n"
+        "クスッと笑える、あるいは「なんでやねん」と言いたくなるボケをかましてください。"
+    ),
+})
+
+
 @dataclass(slots=True)
 class OpenAIThemeClient(ThemeAIClient):
     """OpenAI Chat Completions-backed theme generator."""
@@ -636,37 +1090,12 @@ class OpenAIThemeClient(ThemeAIClient):
     model: str = "gpt-4o-mini"
     endpoint: str = "https://api.openai.com/v1/chat/completions"
     timeout: float = 10.0
+    parallel_attempts: int = 1
+    hedge_delay_seconds: float = 0.0
+    stream_responses: bool = False
 
     # カテゴリー別のプロンプト定義
-    CATEGORY_PROMPTS = {
-        "恋愛": (
-            "恋愛・片思い・デート・別れなど、恋にまつわるシーンを表現してください。"
-            "「甘酸っぱい青春」「大人の苦い恋」「運命の出会い」など、"
-            "読んだ人が自分の思い出を重ねたくなるような、エモーショナルな句にしてください。"
-        ),
-        "季節": (
-            "季節感、天気、自然の移り変わりを表現してください。"
-            "単なる風景描写だけでなく、「その季節ならではの匂い・温度・感情」を"
-            "呼び起こすような、五感に訴える表現を目指してください。\n"
-            "【重要】現在の季節: {season_info}"
-        ),
-        "日常": (
-            "通勤・通学、食事、仕事、家事などの日常シーンを切り取ってください。"
-            "「あるある」と共感できる瞬間や、普段見落としがちな小さな幸せ・発見を"
-            "ユニークな視点で表現してください。"
-        ),
-        "ユーモア": (
-            "ユーザーが思わず「下の句」でツッコミを入れたくなるような『大喜利のフリ』となる句を作ってください。"
-            "以下の5つのパターンのいずれかを意識してください:\n"
-            "1. 【自虐・失敗】自分のダメな部分や、日常の悲しい失敗談。\n"
-            "2. 【シュール】現実ではありえない状況設定。\n"
-            "3. 【社会風刺】会社や学校、世の中への皮肉。\n"
-            "4. 【ブラックユーモア】人生の不条理、存在の虚しさ、世代間ギャップ、"
-            "老い、孤独、締切、税金など「笑うしかない現実」を皮肉たっぷりに詠む。"
-            "毒があるが品がある、読んだ人が「わかる…」と苦笑いするような句を目指してください。\n"
-            "クスッと笑える、あるいは「なんでやねん」と言いたくなるボケをかましてください。"
-        ),
-    }
+    CATEGORY_PROMPTS = OPENAI_CATEGORY_PROMPTS
 
     def generate(
         self,
@@ -681,161 +1110,264 @@ class OpenAIThemeClient(ThemeAIClient):
         """
         MAX_RETRIES = 20
 
-        # カテゴリーに応じたプロンプトを取得
-        category_instruction = self.CATEGORY_PROMPTS.get(
-            category,
-            f"「{category}」というテーマで現代的な表現を使ってください。"
-        )
-        # 季節情報をプロンプトに挿入
-        season_info = get_season_info(target_date)
-        category_instruction = category_instruction.format(season_info=season_info)
+        # カテゴリーに応じたプロンプトを取得（季節情報を挿入）
+        category_instruction = _category_instruction(self.CATEGORY_PROMPTS, category, target_date)
 
         # 過去のお題を避けるための指示を構築
-        past_themes_instruction = ""
-        if past_themes:
-            # 最新10件を表示（プロンプトが長くなりすぎないように）
-            recent_themes = past_themes[:30]
-            past_list = "\n".join(f"- {t.replace(chr(10), ' / ')}" for t in recent_themes)
-            past_themes_instruction = (
-                f"\n\n【重要：過去のお題との重複禁止】\n"
-                f"以下は過去に出題されたお題です。これらと同じ・類似のお題は絶対に作らないでください。\n"
-                f"新しい視点、新しい言葉の組み合わせで、まだ詠まれていないお題を創作してください。\n"
-                f"{past_list}"
-            )
+        past_themes_instruction = _past_themes_instruction(past_themes)
 
         payload = {
             "model": self.model,
             "messages": [
-                {
-                    "role": "system",
-                    "content": (
-                        "あなたは音数（モーラ数）に精通した現代的でポップな俳句の「上の句」を作る詩人です。\n"
-                        "必ず5-7-5の音数を守り、一音一音数えながら作句します。\n\n"
-                        "【重要：音数カウントルール】\n"
-                        "以下すべて1音（1モーラ）として数えます：\n"
-                        "1. 通常の仮名：「あ」「か」「さ」など → 各1音\n"
-                        "2. 促音「っ」 → 1音（例：がっこう=4音）\n"
-                        "3. 撥音「ん」 → 1音（例：さんぽ=3音）\n"
-                        "4. 長音「ー」 → 1音（例：コーヒー=4音）\n"
-                        "5. 拗音「きゃ」「しょ」「ちゅ」 → 各1音\n"
-                        "6. 小さい「ゃゅょ」 → 前の文字と合わせて1音\n\n"
-                        "注意：文字数≠音数です。音数で数えてください。"
-                    ),
-                },
-                {
-                    "role": "user",
-                    "content": "恋愛をテーマに、下の句で完結する5-7-5の上の句を作ってください。音数を数えてから作ってください。"
-                },
-                {
-                    "role": "assistant",
-                    "content": "すれ違う（す1れ2ち3が4う5）\nいつもの駅で（い1つ2も3の4え5き6で7）\nまた会えた（ま1た2あ3え4た5）"
-                },
-                {
-                    "role": "user",
-                    "content": "季節をテーマに、下の句で完結する5-7-5の上の句を作ってください。音数を数えてから作ってください。"
-                },
-                {
-                    "role": "assistant",
-                    "content": "傘なくて（か1さ2な3く4て5）\nにわか雨降る（に1わ2か3あ4め5ふ6る7）\n君と僕（き1み2と3ぼ4く5）"
-                },
-                {
-                    "role": "user",
-                    "content": "日常をテーマに、下の句で完結する5-7-5の上の句を作ってください。音数を数えてから作ってください。"
-                },
-                {
-                    "role": "assistant",
-                    "content": "寝過ごして（ね1す2ご3し4て5）\n電車の中で（で1ん2しゃ3の4な5か6で7）\n目が覚める（め1が2さ3め4る5）"
-                },
+                *OPENAI_STATIC_MESSAGES,
                 {
                     "role": "user",
-                    "content": (
-                        f"以下の条件で、ユーザーが下の句を続けたくなる「上の句」を作成してください。\n"
-                        f"**作成前に必ず一音ずつ数えて、5-7-5を厳密に確認してください。**\n\n"
-                        f"【音数の厳守（絶対条件）】\n"
-                        f"- 1行目：必ず正確に5音（例: す・れ・ち・が・う）\n"
-                        f"- 2行目：必ず正確に7音（例: い・つ・も・の・え・き・で）\n"
-                        f"- 3行目：必ず正確に5音（例: ま・た・あ・え・た）\n"
-                        f"- 音数が合わない句は絶対に出力しないでください\n\n"
-                        f"【独創性（重要）】\n"
-                        f"- ありきたりな表現は避ける\n"
-                        f"- 意外性のある視点や切り口を見つける\n"
-                        f"- 見慣れた風景に新しい発見をもたらす\n"
-                        f"- 読んだ人が「なるほど！」と思える表現\n\n"
-                        f"【示唆に富んだ表現（重要）】\n"
-                        f"- 単なる事実の羅列ではなく、深い意味を含める\n"
-                        f"- 読む人の想像力を刺激する言葉選び\n"
-                        f"- 多義的な解釈ができる余韻を持たせる\n"
-                        f"- 印象に残る、心に響く表現を目指す\n\n"
-                        f"【下の句で完結させる】\n"
-                        f"- 上の句では完結させず、余韻を残す\n"
-                        f"- 情景描写に留め、感情や結論は下の句に委ねる\n"
-                        f"- 「〜てる」「〜いる」「〜した」など、続きを想像させる表現\n"
-                        f"- ユーザーが「続きを詠みたい！」と思える内容\n\n"
-                        f"【表現スタイル】\n"
-                        f"- 現代的でポップな言葉を使用\n"
-                        f"- ひらがな・カタカナ・漢字を自然にミックス\n"
-                        f"- 情景が目に浮かぶ具体的な表現\n"
-                        f"- テーマ: {category_instruction}"
-                        f"{past_themes_instruction}\n\n"
-                        f"【出力形式】\n"
-                        f"- 必ず3行（1行目5音/2行目7音/3行目5音）\n"
-                        f"- 句のみ出力（音数カウントや説明は不要）\n"
-                        f"- 例: すれ違う\\nいつもの駅で\\nまた会えた"
+                    "content": _render_user_prompt(
+                        OPENAI_USER_PROMPT_TEMPLATE,
+                        category_instruction,
+                        past_themes_instruction,
                     ),
                 },
             ],
             "temperature": 1.0,
             "max_tokens": 100,
         }
+        if self.stream_responses:
+            # Stream so attempts can be abandoned as soon as a line misses 5-7-5
+            payload["stream"] = True
 
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
 
-        last_content = None
-        last_counts = None
+        # Serialise the (large, few-shot) payload once and reuse it for every attempt
+        body = orjson.dumps(payload)
+        attempts = _iter_attempts(
+            partial(self._request_verse, body, headers, stream=self.stream_responses),
+            max_attempts=MAX_RETRIES,
+            parallel=self.parallel_attempts,
+            hedge_delay=self.hedge_delay_seconds,
+        )
+        return _first_valid_verse("OpenAI", attempts, MAX_RETRIES)
 
-        for attempt in range(1, MAX_RETRIES + 1):
-            try:
-                response = requests.post(self.endpoint, json=payload, headers=headers, timeout=self.timeout)
-            except requests.RequestException as exc:  # pragma: no cover - network failure path
-                raise ThemeAIClientError("Failed to call OpenAI completions endpoint") from exc
+    def _request_verse(self, body: bytes, headers: dict[str, str], stream: bool = False) -> str:
+        """Call the completions endpoint once and return the stripped verse."""
+        try:
+            response = _post_with_backoff(
+                self.endpoint,
+                data=body,
+                headers=headers,
+                timeout=self.timeout,
+                stream=stream,
+            )
+        except requests.RequestException as exc:  # pragma: no cover - network failure path
+            raise ThemeAIClientError("Failed to call OpenAI completions endpoint") from exc
 
-            try:
-                response.raise_for_status()
-            except requests.HTTPError as exc:
-                raise ThemeAIClientError(f"OpenAI API returned {response.status_code}") from exc
+        try:
+            response.raise_for_status()
+        except requests.HTTPError as exc:
+            if stream:
+                # An unread streamed body would keep its pooled connection checked out
+                response.close()
+            raise ThemeAIClientError(f"OpenAI API returned {response.status_code}") from exc
 
+        if stream:
             try:
-                payload_json = response.json()
+                return _read_streamed_verse(_iter_sse_text_deltas(response)).strip()
             except ValueError as exc:
-                raise ThemeAIClientError("OpenAI API returned invalid JSON") from exc
-
-            try:
-                content = payload_json["choices"][0]["message"]["content"]
-            except (KeyError, IndexError, TypeError) as exc:
-                raise ThemeAIClientError("OpenAI API response missing message content") from exc
+                raise ThemeAIClientError("OpenAI API returned an invalid stream chunk") from exc
+            except requests.RequestException as exc:  # pragma: no cover - network failure path
+                raise ThemeAIClientError("OpenAI completions stream was interrupted") from exc
+            finally:
+                # Closing early drops the connection, which stops generation
+                response.close()
 
-            content = content.strip()
-            is_valid, counts = validate_575(content)
+        try:
+            payload_json = orjson.loads(response.content)
+        except ValueError as exc:
+            raise ThemeAIClientError("OpenAI API returned invalid JSON") from exc
 
-            lines = content.split('\n')
-            lines_detail = " | ".join([f"'{line}' ({count})" for line, count in zip(lines, counts if counts else [])])
+        try:
+            content = payload_json["choices"][0]["message"]["content"]
+        except (KeyError, IndexError, TypeError) as exc:
+            raise ThemeAIClientError("OpenAI API response missing message content") from exc
 
-            if is_valid:
-                logger.info(f"[OpenAI] Success on attempt {attempt}: {lines_detail}")
-                return content
+        return content.strip()
 
-            # Not valid, log and retry
-            last_content = content
-            last_counts = counts
-            logger.warning(f"[OpenAI] Attempt {attempt}/{MAX_RETRIES} failed: expected [5,7,5], got {counts}")
-            logger.warning(f"[OpenAI] Lines: {lines_detail}")
+    def generate_batch(
+        self,
+        *,
+        categories: Sequence[str],
+        target_date: date,
+        past_themes_by_category: Mapping[str, Sequence[str]] | None = None,
+    ) -> dict[str, str]:
+        """Generate one verse per category with a single completions request.
+
+        Each category's recent themes are listed under that category, so every
+        category gets the same history ``generate`` would have sent for it.
+        Only verses that pass 5-7-5 are returned, so callers should fall back
+        to ``generate`` for any category missing from the result.
+        """
+        if not categories:
+            return {}
+
+        past_themes_by_category = past_themes_by_category or {}
+        category_sections = "".join(
+            _batch_category_section(
+                category,
+                _category_instruction(self.CATEGORY_PROMPTS, category, target_date),
+                past_themes_by_category.get(category),
+            )
+            for category in categories
+        )
+        has_history = any(past_themes_by_category.get(category) for category in categories)
+        payload = {
+            "model": self.model,
+            "messages": [
+                *OPENAI_STATIC_MESSAGES,
+                {
+                    "role": "user",
+                    "content": OPENAI_BATCH_USER_PROMPT_TEMPLATE.format(
+                        category_sections=category_sections,
+                        past_themes_instruction=BATCH_PAST_THEMES_INSTRUCTION if has_history else "",
+                    ),
+                },
+            ],
+            "temperature": 1.0,
+            "max_tokens": 100 * len(categories),
+            "response_format": {"type": "json_object"},
+        }
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
 
-        # All retries exhausted, return last attempt with warning
-        logger.error(f"[OpenAI] All {MAX_RETRIES} attempts failed. Using last result with syllables {last_counts}: {last_content}")
-        return last_content or ""
+        content = self._request_verse(orjson.dumps(payload), headers)
+        try:
+            themes = orjson.loads(content)["themes"]
+        except (ValueError, KeyError, TypeError) as exc:
+            raise ThemeAIClientError("OpenAI batch response is not the expected JSON object") from exc
+        if not isinstance(themes, dict):
+            raise ThemeAIClientError("OpenAI batch response has no themes object")
+
+        verses: dict[str, str] = {}
+        for category in categories:
+            verse = themes.get(category)
+            if not isinstance(verse, str):
+                continue
+            verse = verse.strip()
+            is_valid, counts, _ = validate_575(verse)
+            if is_valid:
+                verses[category] = verse
+            else:
+                logger.info("[OpenAI] Batch verse for %s rejected: got %s", category, counts)
+        logger.info("[OpenAI] Batch produced %d/%d valid verses", len(verses), len(categories))
+        return verses
+
+
+XAI_SYSTEM_PROMPT = (
+    "あなたは音数（モーラ数）に精通した現代の詩人ですが、決して気取らず、"
+    "友達とのLINEやSNSのつぶやきのような「話し言葉」で5-7-5の上の句を作ります。\n"
+    "必ず5-7-5の音数を守り、一音一音数えながら作句します。\n\n"
+    "【重要：音数カウントルール】\n"
+    "以下すべて1音（1モーラ）として数えます：\n"
+    "1. 通常の仮名：「あ」「か」「さ」など → 各1音\n"
+    "2. 促音「っ」 → 1音（例：がっこう=4音）\n"
+    "3. 撥音「ん」 → 1音（例：さんぽ=3音）\n"
+    "4. 長音「ー」 → 1音（例：コーヒー=4音）\n"
+    "5. 拗音「きゃ」「しょ」「ちゅ」 → 各1音\n"
+    "6. 小さい「ゃゅょ」 → 前の文字と合わせて1音\n\n"
+    "注意：文字数≠音数です。音数で数えてください。"
+)
+
+
+# Few-shot examples for the conversational X.ai prompt
+XAI_FEW_SHOT_MESSAGES: tuple[dict[str, str], ...] = (
+    {"role": "user", "content": "恋愛をテーマに、下の句で完結する5-7-5の上の句を作ってください。音数を数えてから作ってください。"},
+    {"role": "assistant", "content": "好きな人\nストーリーだけ\n見ちゃってさ"},
+    {"role": "user", "content": "季節をテーマに、下の句で完結する5-7-5の上の句を作ってください。音数を数えてから作ってください。"},
+    {"role": "assistant", "content": "コンビニの\nおでん買っちゃう\n帰り道"},
+)
+
+# System prompt and few-shot turns never change, so build the shared message
+# prefix once; generate() only appends the rendered user prompt.
+XAI_STATIC_MESSAGES: tuple[dict[str, str], ...] = (
+    {"role": "system", "content": XAI_SYSTEM_PROMPT},
+    *XAI_FEW_SHOT_MESSAGES,
+)
+
+
+XAI_USER_PROMPT_TEMPLATE = (
+    "以下の条件で、ユーザーが下の句を続けたくなる「上の句」を作成してください。\n"
+    "**作成前に必ず一音ずつ数えて、5-7-5を厳密に確認してください。**\n"
+    "**3候補を作り、候補と候補の間は必ず `---` だけを1行で入れてください。説明文や番号は不要です。**\n\n"
+    "【音数の厳守（絶対条件）】\n"
+    "- 1行目：必ず正確に5音（例: す・れ・ち・が・う）\n"
+    "- 2行目：必ず正確に7音（例: い・つ・も・の・え・き・で）\n"
+    "- 3行目：必ず正確に5音（例: ま・た・あ・え・た）\n"
+    "- 音数が合わない句は絶対に出力しないでください\n"
+    "- 3候補とも、少しずつ切り口を変えてください\n\n"
+    "【1. 「詩」ではなく「つぶやき」】\n"
+    "- 詩的な表現、芸術的な熟語、古風な言い回しは禁止です。\n"
+    "- 友達とのLINEや、独り言のような自然な「話し言葉」にしてください。\n"
+    "- OK例: コンビニの おでん買っちゃう 帰り道\n"
+    "- NG例: 静寂に 包まれし夜の 星月夜\n\n"
+    "【2. 「未完の文」で終わらせる（余白を作る）】\n"
+    "- 上の句（5-7-5）だけで意味を完結させないでください。\n"
+    "- 「〜なのに」「〜だけど」「〜て」や接続詞などで終わり、ユーザーが下の句で続きを書きやすくしてください。\n"
+    "- OK例: あと5分 布団にいたい 寒いから（→「遅刻するよ」「二度寝確定」など続きが書きやすい）\n"
+    "- NG例: 冬の朝 布団のぬくもり 心地よし（→完結しているので続きにくい）\n\n"
+    "【3. 「映像」か「音」を描写（抽象概念の禁止）】\n"
+    "- 「愛」「未来」「希望」「絶望」などの抽象的な言葉は禁止です。\n"
+    "- 具体的な「モノ」「動作」「聞こえる音」を描写してください。\n"
+    "- OK例: 片一方 なくしたピアス どこ行った\n"
+    "- NG例: 悲しみは いつか癒えると言うけれど\n\n"
+    "【テーマ】\n"
+    "{category_instruction}"
+    "{past_themes_instruction}\n\n"
+    "【出力形式】\n"
+    "- 3候補を出力する\n"
+    "- 各候補は必ず3行（1行目5音/2行目7音/3行目5音）\n"
+    "- 候補の間は `---` の1行だけで区切る\n"
+    "- 句のみ出力（音数カウント、候補番号、説明、理由は不要）\n"
+    "- 例:\n"
+    "すれ違う\\nいつもの駅で\\nまた会えた\\n---\\n"
+    "傘なくて\\nにわか雨降る\\n君と僕\\n---\\n"
+    "寝過ごして\\n電車の中で\\n目が覚める"
+)
+
+
+# カテゴリー別の「つぶやき」「具体的」重視プロンプト（XAI/PLaMo作句/Geminiで共通）
+TSUBUYAKI_CATEGORY_PROMPTS: Mapping[str, str] = MappingProxyType({
+    "恋愛": (
+        "恋愛・片思い・デート・別れなど、恋にまつわるシーンを「つぶやき」として表現してください。"
+        "「LINEで送るような言葉」や「心の中の独り言」のように、"
+        "飾らない言葉で、誰もが「あるある」と共感できるシーンにしてください。"
+    ),
+    "季節": (
+        "季節感、天気、自然の移り変わりを「具体的な映像」として表現してください。"
+        "難しい言葉は使わず、その季節ならではの「光景」や「音」を切り取ってください。\n"
+        "【重要】現在の季節: {season_info}"
+    ),
+    "日常": (
+        "通勤・通学、食事、仕事、家事などの日常シーンを切り取ってください。"
+        "「あーあ」とため息をつく瞬間や、ふとした瞬間の「独り言」を"
+        "そのまま5-7-5にしてください。"
+    ),
+    "ユーモア": (
+        "ユーザーが思わず「下の句」でツッコミを入れたくなるような『大喜利のフリ』となる句を作ってください。"
+        "以下の5つのパターンのいずれかを意識してください:\n"
+        "1. 【自虐・失敗】自分のダメな部分や、日常の悲しい失敗談。\n"
+        "2. 【シュール】現実ではありえない状況設定。\n"
+        "3. 【社会風刺】会社や学校、世の中への皮肉。\n"
+        "4. 【VS型】「きのこたけのこ」のような究極の選択や論争の火種。\n"
+        "5. 【ブラックユーモア】人生の不条理、存在の虚しさ、世代間ギャップ、"
+        "老い、孤独、締切、税金など「笑うしかない現実」を皮肉たっぷりに詠む。"
+        "毒があるが品がある、読んだ人が「わかる…」と苦笑いするような句を目指してください。\n"
+        "クスッと笑える、あるいは「なんでやねん」と言いたくなるボケをかましてください。"
+    ),
+})
 
 
 @dataclass(slots=True)
@@ -847,36 +1379,7 @@ class XAIThemeClient(ThemeAIClient):
     endpoint: str = "https://api.x.ai/v1/chat/completions"
     timeout: float = 30.0
 
-    # カテゴリー別のプロンプト定義（「つぶやき」「具体的」重視に変更）
-    CATEGORY_PROMPTS = {
-        "恋愛": (
-            "恋愛・片思い・デート・別れなど、恋にまつわるシーンを「つぶやき」として表現してください。"
-            "「LINEで送るような言葉」や「心の中の独り言」のように、"
-            "飾らない言葉で、誰もが「あるある」と共感できるシーンにしてください。"
-        ),
-        "季節": (
-            "季節感、天気、自然の移り変わりを「具体的な映像」として表現してください。"
-            "難しい言葉は使わず、その季節ならではの「光景」や「音」を切り取ってください。\n"
-            "【重要】現在の季節: {season_info}"
-        ),
-        "日常": (
-            "通勤・通学、食事、仕事、家事などの日常シーンを切り取ってください。"
-            "「あーあ」とため息をつく瞬間や、ふとした瞬間の「独り言」を"
-            "そのまま5-7-5にしてください。"
-        ),
-        "ユーモア": (
-            "ユーザーが思わず「下の句」でツッコミを入れたくなるような『大喜利のフリ』となる句を作ってください。"
-            "以下の5つのパターンのいずれかを意識してください:\n"
-            "1. 【自虐・失敗】自分のダメな部分や、日常の悲しい失敗談。\n"
-            "2. 【シュール】現実ではありえない状況設定。\n"
-            "3. 【社会風刺】会社や学校、世の中への皮肉。\n"
-            "4. 【VS型】「きのこたけのこ」のような究極の選択や論争の火種。\n"
-            "5. 【ブラックユーモア】人生の不条理、存在の虚しさ、世代間ギャップ、"
-            "老い、孤独、締切、税金など「笑うしかない現実」を皮肉たっぷりに詠む。"
-            "毒があるが品がある、読んだ人が「わかる…」と苦笑いするような句を目指してください。\n"
-            "クスッと笑える、あるいは「なんでやねん」と言いたくなるボケをかましてください。"
-        ),
-    }
+    CATEGORY_PROMPTS = TSUBUYAKI_CATEGORY_PROMPTS
 
     def _build_openai_judge(self) -> OpenAIThemeJudge | None:
         settings = get_settings()
@@ -898,103 +1401,22 @@ class XAIThemeClient(ThemeAIClient):
         """Generate XAI candidates, then let OpenAI judge select the final theme."""
         MAX_RETRIES = 20
 
-        # カテゴリーに応じたプロンプトを取得
-        category_instruction = self.CATEGORY_PROMPTS.get(
-            category,
-            f"「{category}」というテーマで現代的な表現を使ってください。"
-        )
-        # 季節情報をプロンプトに挿入
-        season_info = get_season_info(target_date)
-        category_instruction = category_instruction.format(season_info=season_info)
+        # カテゴリーに応じたプロンプトを取得（季節情報を挿入）
+        category_instruction = _category_instruction(self.CATEGORY_PROMPTS, category, target_date)
 
         # 過去のお題を避けるための指示を構築
-        past_themes_instruction = ""
-        if past_themes:
-            # 最新10件を表示（プロンプトが長くなりすぎないように）
-            recent_themes = past_themes[:30]
-            past_list = "\n".join(f"- {t.replace(chr(10), ' / ')}" for t in recent_themes)
-            past_themes_instruction = (
-                f"\n\n【重要：過去のお題との重複禁止】\n"
-                f"以下は過去に出題されたお題です。これらと同じ・類似のお題は絶対に作らないでください。\n"
-                f"新しい視点、新しい言葉の組み合わせで、まだ詠まれていないお題を創作してください。\n"
-                f"{past_list}"
-            )
+        past_themes_instruction = _past_themes_instruction(past_themes)
 
         payload = {
             "model": self.model,
             "messages": [
-                {
-                    "role": "system",
-                    "content": (
-                        "あなたは音数（モーラ数）に精通した現代の詩人ですが、決して気取らず、"
-                        "友達とのLINEやSNSのつぶやきのような「話し言葉」で5-7-5の上の句を作ります。\n"
-                        "必ず5-7-5の音数を守り、一音一音数えながら作句します。\n\n"
-                        "【重要：音数カウントルール】\n"
-                        "以下すべて1音（1モーラ）として数えます：\n"
-                        "1. 通常の仮名：「あ」「か」「さ」など → 各1音\n"
-                        "2. 促音「っ」 → 1音（例：がっこう=4音）\n"
-                        "3. 撥音「ん」 → 1音（例：さんぽ=3音）\n"
-                        "4. 長音「ー」 → 1音（例：コーヒー=4音）\n"
-                        "5. 拗音「きゃ」「しょ」「ちゅ」 → 各1音\n"
-                        "6. 小さい「ゃゅょ」 → 前の文字と合わせて1音\n\n"
-                        "注意：文字数≠音数です。音数で数えてください。"
-                    ),
-                },
-                {
-                    "role": "user",
-                    "content": "恋愛をテーマに、下の句で完結する5-7-5の上の句を作ってください。音数を数えてから作ってください。"
-                },
-                {
-                    "role": "assistant",
-                    "content": "好きな人\nストーリーだけ\n見ちゃってさ"
-                },
-                {
-                    "role": "user",
-                    "content": "季節をテーマに、下の句で完結する5-7-5の上の句を作ってください。音数を数えてから作ってください。"
-                },
-                {
-                    "role": "assistant",
-                    "content": "コンビニの\nおでん買っちゃう\n帰り道"
-                },
+                *XAI_STATIC_MESSAGES,
                 {
                     "role": "user",
-                    "content": (
-                        f"以下の条件で、ユーザーが下の句を続けたくなる「上の句」を作成してください。\n"
-                        f"**作成前に必ず一音ずつ数えて、5-7-5を厳密に確認してください。**\n"
-                        f"**3候補を作り、候補と候補の間は必ず `---` だけを1行で入れてください。説明文や番号は不要です。**\n\n"
-                        f"【音数の厳守（絶対条件）】\n"
-                        f"- 1行目：必ず正確に5音（例: す・れ・ち・が・う）\n"
-                        f"- 2行目：必ず正確に7音（例: い・つ・も・の・え・き・で）\n"
-                        f"- 3行目：必ず正確に5音（例: ま・た・あ・え・た）\n"
-                        f"- 音数が合わない句は絶対に出力しないでください\n"
-                        f"- 3候補とも、少しずつ切り口を変えてください\n\n"
-                        f"【1. 「詩」ではなく「つぶやき」】\n"
-                        f"- 詩的な表現、芸術的な熟語、古風な言い回しは禁止です。\n"
-                        f"- 友達とのLINEや、独り言のような自然な「話し言葉」にしてください。\n"
-                        f"- OK例: コンビニの おでん買っちゃう 帰り道\n"
-                        f"- NG例: 静寂に 包まれし夜の 星月夜\n\n"
-                        f"【2. 「未完の文」で終わらせる（余白を作る）】\n"
-                        f"- 上の句（5-7-5）だけで意味を完結させないでください。\n"
-                        f"- 「〜なのに」「〜だけど」「〜て」や接続詞などで終わり、ユーザーが下の句で続きを書きやすくしてください。\n"
-                        f"- OK例: あと5分 布団にいたい 寒いから（→「遅刻するよ」「二度寝確定」など続きが書きやすい）\n"
-                        f"- NG例: 冬の朝 布団のぬくもり 心地よし（→完結しているので続きにくい）\n\n"
-                        f"【3. 「映像」か「音」を描写（抽象概念の禁止）】\n"
-                        f"- 「愛」「未来」「希望」「絶望」などの抽象的な言葉は禁止です。\n"
-                        f"- 具体的な「モノ」「動作」「聞こえる音」を描写してください。\n"
-                        f"- OK例: 片一方 なくしたピアス どこ行った\n"
-                        f"- NG例: 悲しみは いつか癒えると言うけれど\n\n"
-                        f"【テーマ】\n"
-                        f"{category_instruction}"
-                        f"{past_themes_instruction}\n\n"
-                        f"【出力形式】\n"
-                        f"- 3候補を出力する\n"
-                        f"- 各候補は必ず3行（1行目5音/2行目7音/3行目5音）\n"
-                        f"- 候補の間は `---` の1行だけで区切る\n"
-                        f"- 句のみ出力（音数カウント、候補番号、説明、理由は不要）\n"
-                        f"- 例:\n"
-                        f"すれ違う\\nいつもの駅で\\nまた会えた\\n---\\n"
-                        f"傘なくて\\nにわか雨降る\\n君と僕\\n---\\n"
-                        f"寝過ごして\\n電車の中で\\n目が覚める"
+                    "content": _render_user_prompt(
+                        XAI_USER_PROMPT_TEMPLATE,
+                        category_instruction,
+                        past_themes_instruction,
                     ),
                 },
             ],
@@ -1009,10 +1431,11 @@ class XAIThemeClient(ThemeAIClient):
 
         judge = self._build_openai_judge()
         last_error: str | None = None
+        body = orjson.dumps(payload)
 
         for attempt in range(1, MAX_RETRIES + 1):
             try:
-                response = requests.post(self.endpoint, json=payload, headers=headers, timeout=self.timeout)
+                response = _post_with_backoff(self.endpoint, data=body, headers=headers, timeout=self.timeout)
             except requests.RequestException as exc:  # pragma: no cover - network failure path
                 raise ThemeAIClientError("Failed to call X.ai API endpoint") from exc
 
@@ -1022,7 +1445,7 @@ class XAIThemeClient(ThemeAIClient):
                 raise ThemeAIClientError(f"X.ai API returned {response.status_code}") from exc
 
             try:
-                payload_json = response.json()
+                payload_json = orjson.loads(response.content)
             except ValueError as exc:
                 raise ThemeAIClientError("X.ai API returned invalid JSON") from exc
 
@@ -1068,7 +1491,7 @@ class XAIThemeClient(ThemeAIClient):
                     selected_candidate = next(
                         candidate for candidate in filtered_candidates if candidate.index == judge_result.selected_index
                     )
-                    is_valid, counts = validate_575(selected_candidate.text)
+                    is_valid, counts, _ = validate_575(selected_candidate.text)
                     log_payload["final_counts"] = counts
                     if is_valid:
                         _log_xai_selection("selected_by_openai", log_payload)
@@ -1144,35 +1567,7 @@ class PLaMoThemeClient(ThemeAIClient):
     }
 
     # カテゴリー別のXAI作句プロンプト（XAIThemeClientと統一）
-    CATEGORY_COMPOSE_PROMPTS = {
-        "恋愛": (
-            "恋愛・片思い・デート・別れなど、恋にまつわるシーンを「つぶやき」として表現してください。"
-            "「LINEで送るような言葉」や「心の中の独り言」のように、"
-            "飾らない言葉で、誰もが「あるある」と共感できるシーンにしてください。"
-        ),
-        "季節": (
-            "季節感、天気、自然の移り変わりを「具体的な映像」として表現してください。"
-            "難しい言葉は使わず、その季節ならではの「光景」や「音」を切り取ってください。\n"
-            "【重要】現在の季節: {season_info}"
-        ),
-        "日常": (
-            "通勤・通学、食事、仕事、家事などの日常シーンを切り取ってください。"
-            "「あーあ」とため息をつく瞬間や、ふとした瞬間の「独り言」を"
-            "そのまま5-7-5にしてください。"
-        ),
-        "ユーモア": (
-            "ユーザーが思わず「下の句」でツッコミを入れたくなるような『大喜利のフリ』となる句を作ってください。"
-            "以下の5つのパターンのいずれかを意識してください:\n"
-            "1. 【自虐・失敗】自分のダメな部分や、日常の悲しい失敗談。\n"
-            "2. 【シュール】現実ではありえない状況設定。\n"
-            "3. 【社会風刺】会社や学校、世の中への皮肉。\n"
-            "4. 【VS型】「きのこたけのこ」のような究極の選択や論争の火種。\n"
-            "5. 【ブラックユーモア】人生の不条理、存在の虚しさ、世代間ギャップ、"
-            "老い、孤独、締切、税金など「笑うしかない現実」を皮肉たっぷりに詠む。"
-            "毒があるが品がある、読んだ人が「わかる…」と苦笑いするような句を目指してください。\n"
-            "クスッと笑える、あるいは「なんでやねん」と言いたくなるボケをかましてください。"
-        ),
-    }
+    CATEGORY_COMPOSE_PROMPTS = TSUBUYAKI_CATEGORY_PROMPTS
 
     def _build_openai_judge(self) -> OpenAIThemeJudge | None:
         settings = get_settings()
@@ -1192,16 +1587,17 @@ class PLaMoThemeClient(ThemeAIClient):
         past_themes: list[str] | None = None,
     ) -> str:
         """Stage 1: Ask PLaMo for creative scene ideas and keywords."""
-        season_info = get_season_info(target_date)
-        idea_prompt = self.CATEGORY_IDEA_PROMPTS.get(
-            category,
-            f"「{category}」に関連する日常的なシーン・言葉・モチーフを5つ提案してください。"
-        ).format(season_info=season_info)
+        idea_prompt = _fill_season_info(
+            self.CATEGORY_IDEA_PROMPTS.get(
+                category,
+                f"「{category}」に関連する日常的なシーン・言葉・モチーフを5つ提案してください。"
+            ),
+            target_date,
+        )
 
         past_instruction = ""
         if past_themes:
-            recent = past_themes[:30]
-            past_list = "\n".join(f"- {t.replace(chr(10), ' / ')}" for t in recent)
+            past_list = _format_past_theme_list(past_themes)
             past_instruction = (
                 f"\n\n【重要：過去のお題との差別化】\n"
                 f"以下は直近に出題されたお題です。これらと**同じシーン、同じモチーフ、同じ言葉、似た展開**のアイデアは絶対に出さないでください。\n"
@@ -1247,7 +1643,7 @@ class PLaMoThemeClient(ThemeAIClient):
         }
 
         try:
-            response = requests.post(self.endpoint, json=payload, headers=headers, timeout=self.timeout)
+            response = _post_with_backoff(self.endpoint, json=payload, headers=headers, timeout=self.timeout)
         except requests.RequestException as exc:
             raise ThemeAIClientError("Failed to call PLaMo API for ideation") from exc
 
@@ -1264,7 +1660,7 @@ class PLaMoThemeClient(ThemeAIClient):
             ) from exc
 
         try:
-            payload_json = response.json()
+            payload_json = orjson.loads(response.content)
             content = payload_json["choices"][0]["message"]["content"]
         except (ValueError, KeyError, IndexError, TypeError) as exc:
             raise ThemeAIClientError("PLaMo ideation response is malformed") from exc
@@ -1280,16 +1676,11 @@ class PLaMoThemeClient(ThemeAIClient):
         past_themes: list[str] | None = None,
     ) -> str:
         """Stage 2: Ask XAI to compose strict 5-7-5 candidates from PLaMo ideas."""
-        season_info = get_season_info(target_date)
-        category_instruction = self.CATEGORY_COMPOSE_PROMPTS.get(
-            category,
-            f"「{category}」というテーマで現代的な表現を使ってください。"
-        ).format(season_info=season_info)
+        category_instruction = _category_instruction(self.CATEGORY_COMPOSE_PROMPTS, category, target_date)
 
         past_themes_instruction = ""
         if past_themes:
-            recent = past_themes[:30]
-            past_list = "\n".join(f"- {t.replace(chr(10), ' / ')}" for t in recent)
+            past_list = _format_past_theme_list(past_themes)
             past_themes_instruction = (
                 f"\n\n【重要：過去のお題と似た句の禁止】\n"
                 f"以下は直近に出題されたお題です。これらと**同じモチーフ・同じ場面・似た言葉遣い**の句は作らないでください。\n"
@@ -1382,7 +1773,7 @@ class PLaMoThemeClient(ThemeAIClient):
         }
 
         try:
-            response = requests.post(self.xai_endpoint, json=payload, headers=headers, timeout=self.xai_timeout)
+            response = _post_with_backoff(self.xai_endpoint, json=payload, headers=headers, timeout=self.xai_timeout)
         except requests.RequestException as exc:
             raise ThemeAIClientError(f"Failed to call XAI API for composition: {exc}") from exc
 
@@ -1397,7 +1788,7 @@ class PLaMoThemeClient(ThemeAIClient):
             raise ThemeAIClientError(f"XAI composition API returned {response.status_code}: {body}") from exc
 
         try:
-            payload_json = response.json()
+            payload_json = orjson.loads(response.content)
             content = payload_json["choices"][0]["message"]["content"]
         except (ValueError, KeyError, IndexError, TypeError) as exc:
             raise ThemeAIClientError("XAI composition response is malformed") from exc
@@ -1491,7 +1882,7 @@ class PLaMoThemeClient(ThemeAIClient):
                     selected_candidate = next(
                         c for c in filtered_candidates if c.index == judge_result.selected_index
                     )
-                    is_valid, counts = validate_575(selected_candidate.text)
+                    is_valid, counts, _ = validate_575(selected_candidate.text)
                     log_payload["final_counts"] = counts
                     if is_valid:
                         _log_xai_selection("selected_by_openai", log_payload)
@@ -1533,35 +1924,7 @@ class GeminiThemeClient(ThemeAIClient):
     timeout: float = 60.0
 
     # カテゴリー別のプロンプト定義（XAIThemeClientと統一）
-    CATEGORY_PROMPTS = {
-        "恋愛": (
-            "恋愛・片思い・デート・別れなど、恋にまつわるシーンを「つぶやき」として表現してください。"
-            "「LINEで送るような言葉」や「心の中の独り言」のように、"
-            "飾らない言葉で、誰もが「あるある」と共感できるシーンにしてください。"
-        ),
-        "季節": (
-            "季節感、天気、自然の移り変わりを「具体的な映像」として表現してください。"
-            "難しい言葉は使わず、その季節ならではの「光景」や「音」を切り取ってください。\n"
-            "【重要】現在の季節: {season_info}"
-        ),
-        "日常": (
-            "通勤・通学、食事、仕事、家事などの日常シーンを切り取ってください。"
-            "「あーあ」とため息をつく瞬間や、ふとした瞬間の「独り言」を"
-            "そのまま5-7-5にしてください。"
-        ),
-        "ユーモア": (
-            "ユーザーが思わず「下の句」でツッコミを入れたくなるような『大喜利のフリ』となる句を作ってください。"
-            "以下の5つのパターンのいずれかを意識してください:\n"
-            "1. 【自虐・失敗】自分のダメな部分や、日常の悲しい失敗談。\n"
-            "2. 【シュール】現実ではありえない状況設定。\n"
-            "3. 【社会風刺】会社や学校、世の中への皮肉。\n"
-            "4. 【VS型】「きのこたけのこ」のような究極の選択や論争の火種。\n"
-            "5. 【ブラックユーモア】人生の不条理、存在の虚しさ、世代間ギャップ、"
-            "老い、孤独、締切、税金など「笑うしかない現実」を皮肉たっぷりに詠む。"
-            "毒があるが品がある、読んだ人が「わかる…」と苦笑いするような句を目指してください。\n"
-            "クスッと笑える、あるいは「なんでやねん」と言いたくなるボケをかましてください。"
-        ),
-    }
+    CATEGORY_PROMPTS = TSUBUYAKI_CATEGORY_PROMPTS
 
     def _build_gemini_judge(self) -> GeminiThemeJudge:
         return GeminiThemeJudge(
@@ -1580,26 +1943,11 @@ class GeminiThemeClient(ThemeAIClient):
         """Generate Gemini candidates, then let Gemini judge select the final theme."""
         MAX_RETRIES = 20
 
-        # カテゴリーに応じたプロンプトを取得
-        category_instruction = self.CATEGORY_PROMPTS.get(
-            category,
-            f"「{category}」というテーマで現代的な表現を使ってください。"
-        )
-        # 季節情報をプロンプトに挿入
-        season_info = get_season_info(target_date)
-        category_instruction = category_instruction.format(season_info=season_info)
+        # カテゴリーに応じたプロンプトを取得（季節情報を挿入）
+        category_instruction = _category_instruction(self.CATEGORY_PROMPTS, category, target_date)
 
         # 過去のお題を避けるための指示を構築
-        past_themes_instruction = ""
-        if past_themes:
-            recent_themes = past_themes[:30]
-            past_list = "\n".join(f"- {t.replace(chr(10), ' / ')}" for t in recent_themes)
-            past_themes_instruction = (
-                f"\n\n【重要：過去のお題との重複禁止】\n"
-                f"以下は過去に出題されたお題です。これらと同じ・類似のお題は絶対に作らないでください。\n"
-                f"新しい視点、新しい言葉の組み合わせで、まだ詠まれていないお題を創作してください。\n"
-                f"{past_list}"
-            )
+        past_themes_instruction = _past_themes_instruction(past_themes)
 
         payload = {
             "model": self.model,
@@ -1689,7 +2037,7 @@ class GeminiThemeClient(ThemeAIClient):
 
         for attempt in range(1, MAX_RETRIES + 1):
             try:
-                response = requests.post(self.endpoint, json=payload, headers=headers, timeout=self.timeout)
+                response = _post_with_backoff(self.endpoint, json=payload, headers=headers, timeout=self.timeout)
             except requests.RequestException as exc:
                 raise ThemeAIClientError("Failed to call Gemini API endpoint") from exc
 
@@ -1704,7 +2052,7 @@ class GeminiThemeClient(ThemeAIClient):
                 raise ThemeAIClientError(f"Gemini API returned {response.status_code}: {body}") from exc
 
             try:
-                payload_json = response.json()
+                payload_json = orjson.loads(response.content)
             except ValueError as exc:
                 raise ThemeAIClientError("Gemini API returned invalid JSON") from exc
 
@@ -1751,7 +2099,7 @@ class GeminiThemeClient(ThemeAIClient):
                 selected_candidate = next(
                     c for c in filtered_candidates if c.index == judge_result.selected_index
                 )
-                is_valid, counts = validate_575(selected_candidate.text)
+                is_valid, counts, _ = validate_575(selected_candidate.text)
                 log_payload["final_counts"] = counts
                 if is_valid:
                     _log_xai_selection("selected_by_gemini", log_payload)
@@ -1779,6 +2127,45 @@ class GeminiThemeClient(ThemeAIClient):
         raise ThemeAIClientError(last_error or "Gemini failed to produce a valid theme candidate")
 
 
+# ユーザープロンプト（改善版：ひらがな出力・独創性重視）
+CLAUDE_USER_PROMPT_TEMPLATE = (
+    "以下の条件で、ユーザーが下の句を続けたくなる「上の句」を作成してください。\n"
+    "**作成前に必ず一音ずつ数えて、5-7-5を厳密に確認してください。**\n\n"
+    "【音数の厳守（絶対条件）】\n"
+    "- 1行目：必ず正確に5音（例: す・れ・ち・が・う）\n"
+    "- 2行目：必ず正確に7音（例: い・つ・も・の・え・き・で）\n"
+    "- 3行目：必ず正確に5音（例: ま・た・あ・え・た）\n"
+    "- 音数が合わない句は絶対に出力しないでください\n\n"
+    "【重要：すべてひらがなで出力】\n"
+    "- 漢字・カタカナは一切使わず、すべてひらがなで表現\n"
+    "- 例: 「カフェ」→「かふぇ」、「駅」→「えき」\n\n"
+    "【独創性（重要）】\n"
+    "- ありきたりな表現は避ける\n"
+    "- 意外性のある視点や切り口を見つける\n"
+    "- 見慣れた風景に新しい発見をもたらす\n"
+    "- 読んだ人が「なるほど！」と思える表現\n\n"
+    "【下の句で完結させる】\n"
+    "- 上の句では完結させず、余韻を残す\n"
+    "- 情景描写に留め、感情や結論は下の句に委ねる\n"
+    "- 「〜てる」「〜いる」「〜した」など、続きを想像させる表現\n"
+    "- ユーザーが「続きを詠みたい！」と思える内容\n\n"
+    "【テーマ】\n"
+    "{category_instruction}"
+    "{past_themes_instruction}\n\n"
+    "【出力形式】\n"
+    "- 必ず3行（1行目5音/2行目7音/3行目5音）\n"
+    "- すべてひらがなのみ\n"
+    "- 句のみ出力（音数カウントや説明は不要）\n"
+    "- 例: すれちがう\\nいつものえきで\\nまたあえた"
+)
+
+
+CLAUDE_CATEGORY_PROMPTS: Mapping[str, str] = MappingProxyType({
+    **OPENAI_CATEGORY_PROMPTS,
+    "ユーモア": TSUBUYAKI_CATEGORY_PROMPTS["ユーモア"],
+})
+
+
 @dataclass(slots=True)
 class ClaudeThemeClient(ThemeAIClient):
     """Anthropic Claude-backed theme generator."""
@@ -1786,38 +2173,13 @@ class ClaudeThemeClient(ThemeAIClient):
     api_key: str
     model: str = "claude-sonnet-4-5-20250929"
     timeout: float = 30.0
+    parallel_attempts: int = 1
+    hedge_delay_seconds: float = 0.0
+    stream_responses: bool = False
+    _client: anthropic.Anthropic | None = field(default=None, init=False, repr=False)
 
-    # カテゴリー別のプロンプト定義（OpenAI/XAIと統一）
-    CATEGORY_PROMPTS = {
-        "恋愛": (
-            "恋愛・片思い・デート・別れなど、恋にまつわるシーンを表現してください。"
-            "「甘酸っぱい青春」「大人の苦い恋」「運命の出会い」など、"
-            "読んだ人が自分の思い出を重ねたくなるような、エモーショナルな句にしてください。"
-        ),
-        "季節": (
-            "季節感、天気、自然の移り変わりを表現してください。"
-            "単なる風景描写だけでなく、「その季節ならではの匂い・温度・感情」を"
-            "呼び起こすような、五感に訴える表現を目指してください。\n"
-            "【重要】現在の季節: {season_info}"
-        ),
-        "日常": (
-            "通勤・通学、食事、仕事、家事などの日常シーンを切り取ってください。"
-            "「あるある」と共感できる瞬間や、普段見落としがちな小さな幸せ・発見を"
-            "ユニークな視点で表現してください。"
-        ),
-        "ユーモア": (
-            "ユーザーが思わず「下の句」でツッコミを入れたくなるような『大喜利のフリ』となる句を作ってください。"
-            "以下の5つのパターンのいずれかを意識してください:\n"
-            "1. 【自虐・失敗】自分のダメな部分や、日常の悲しい失敗談。\n"
-            "2. 【シュール】現実ではありえない状況設定。\n"
-            "3. 【社会風刺】会社や学校、世の中への皮肉。\n"
-            "4. 【VS型】「きのこたけのこ」のような究極の選択や論争の火種。\n"
-            "5. 【ブラックユーモア】人生の不条理、存在の虚しさ、世代間ギャップ、"
-            "老い、孤独、締切、税金など「笑うしかない現実」を皮肉たっぷりに詠む。"
-            "毒があるが品がある、読んだ人が「わかる…」と苦笑いするような句を目指してください。\n"
-            "クスッと笑える、あるいは「なんでやねん」と言いたくなるボケをかましてください。"
-        ),
-    }
+    # カテゴリー別のプロンプト定義（恋愛・季節・日常はOpenAI、ユーモアはXAIと統一）
+    CATEGORY_PROMPTS = CLAUDE_CATEGORY_PROMPTS
 
     def generate(
         self,
@@ -1832,129 +2194,78 @@ class ClaudeThemeClient(ThemeAIClient):
         """
         MAX_RETRIES = 20
 
-        # カテゴリーに応じたプロンプトを取得
-        category_instruction = self.CATEGORY_PROMPTS.get(
-            category,
-            f"「{category}」というテーマで現代的な表現を使ってください。"
-        )
-        # 季節情報をプロンプトに挿入
-        season_info = get_season_info(target_date)
-        category_instruction = category_instruction.format(season_info=season_info)
+        # カテゴリーに応じたプロンプトを取得（季節情報を挿入）
+        category_instruction = _category_instruction(self.CATEGORY_PROMPTS, category, target_date)
 
         # 過去のお題を避けるための指示を構築
-        past_themes_instruction = ""
-        if past_themes:
-            # 最新10件を表示（プロンプトが長くなりすぎないように）
-            recent_themes = past_themes[:30]
-            past_list = "\n".join(f"- {t.replace(chr(10), ' / ')}" for t in recent_themes)
-            past_themes_instruction = (
-                f"\n\n【重要：過去のお題との重複禁止】\n"
-                f"以下は過去に出題されたお題です。これらと同じ・類似のお題は絶対に作らないでください。\n"
-                f"新しい視点、新しい言葉の組み合わせで、まだ詠まれていないお題を創作してください。\n"
-                f"{past_list}"
-            )
+        past_themes_instruction = _past_themes_instruction(past_themes)
 
-        # システムプロンプト
-        system_prompt = (
-            "あなたは音数（モーラ数）に精通した現代的でポップな俳句の「上の句」を作る詩人です。\n"
-            "必ず5-7-5の音数を守り、一音一音数えながら作句します。\n\n"
-            "【重要：音数カウントルール】\n"
-            "以下すべて1音（1モーラ）として数えます：\n"
-            "1. 通常の仮名：「あ」「か」「さ」など → 各1音\n"
-            "2. 促音「っ」 → 1音（例：がっこう=4音）\n"
-            "3. 撥音「ん」 → 1音（例：さんぽ=3音）\n"
-            "4. 長音「ー」 → 1音（例：コーヒー=4音）\n"
-            "5. 拗音「きゃ」「しょ」「ちゅ」 → 各1音\n"
-            "6. 小さい「ゃゅょ」 → 前の文字と合わせて1音\n\n"
-            "注意：文字数≠音数です。音数で数えてください。"
+        system_prompt = THEME_SYSTEM_PROMPT
+        user_prompt = _render_user_prompt(
+            CLAUDE_USER_PROMPT_TEMPLATE,
+            category_instruction,
+            past_themes_instruction,
         )
 
-        # ユーザープロンプト（改善版：ひらがな出力・独創性重視）
-        user_prompt = (
-            f"以下の条件で、ユーザーが下の句を続けたくなる「上の句」を作成してください。\n"
-            f"**作成前に必ず一音ずつ数えて、5-7-5を厳密に確認してください。**\n\n"
-            f"【音数の厳守（絶対条件）】\n"
-            f"- 1行目：必ず正確に5音（例: す・れ・ち・が・う）\n"
-            f"- 2行目：必ず正確に7音（例: い・つ・も・の・え・き・で）\n"
-            f"- 3行目：必ず正確に5音（例: ま・た・あ・え・た）\n"
-            f"- 音数が合わない句は絶対に出力しないでください\n\n"
-            f"【重要：すべてひらがなで出力】\n"
-            f"- 漢字・カタカナは一切使わず、すべてひらがなで表現\n"
-            f"- 例: 「カフェ」→「かふぇ」、「駅」→「えき」\n\n"
-            f"【独創性（重要）】\n"
-            f"- ありきたりな表現は避ける\n"
-            f"- 意外性のある視点や切り口を見つける\n"
-            f"- 見慣れた風景に新しい発見をもたらす\n"
-            f"- 読んだ人が「なるほど！」と思える表現\n\n"
-            f"【下の句で完結させる】\n"
-            f"- 上の句では完結させず、余韻を残す\n"
-            f"- 情景描写に留め、感情や結論は下の句に委ねる\n"
-            f"- 「〜てる」「〜いる」「〜した」など、続きを想像させる表現\n"
-            f"- ユーザーが「続きを詠みたい！」と思える内容\n\n"
-            f"【テーマ】\n"
-            f"{category_instruction}"
-            f"{past_themes_instruction}\n\n"
-            f"【出力形式】\n"
-            f"- 必ず3行（1行目5音/2行目7音/3行目5音）\n"
-            f"- すべてひらがなのみ\n"
-            f"- 句のみ出力（音数カウントや説明は不要）\n"
-            f"- 例: すれちがう\\nいつものえきで\\nまたあえた"
+        client = self._get_client()
+
+        attempts = _iter_attempts(
+            partial(
+                self._request_verse,
+                client,
+                system_prompt,
+                [*THEME_FEW_SHOT_MESSAGES, {"role": "user", "content": user_prompt}],
+            ),
+            max_attempts=MAX_RETRIES,
+            parallel=self.parallel_attempts,
+            hedge_delay=self.hedge_delay_seconds,
         )
+        return _first_valid_verse("Claude", attempts, MAX_RETRIES)
 
-        client = anthropic.Anthropic(api_key=self.api_key, timeout=self.timeout)
-
-        # Few-shot examples（OpenAI/XAIと統一）
-        few_shot_messages = [
-            {"role": "user", "content": "恋愛をテーマに、下の句で完結する5-7-5の上の句を作ってください。音数を数えてから作ってください。"},
-            {"role": "assistant", "content": "すれ違う（す1れ2ち3が4う5）\nいつもの駅で（い1つ2も3の4え5き6で7）\nまた会えた（ま1た2あ3え4た5）"},
-            {"role": "user", "content": "季節をテーマに、下の句で完結する5-7-5の上の句を作ってください。音数を数えてから作ってください。"},
-            {"role": "assistant", "content": "傘なくて（か1さ2な3く4て5）\nにわか雨降る（に1わ2か3あ4め5ふ6る7）\n君と僕（き1み2と3ぼ4く5）"},
-            {"role": "user", "content": "日常をテーマに、下の句で完結する5-7-5の上の句を作ってください。音数を数えてから作ってください。"},
-            {"role": "assistant", "content": "寝過ごして（ね1す2ご3し4て5）\n電車の中で（で1ん2しゃ3の4な5か6で7）\n目が覚める（め1が2さ3め4る5）"},
-        ]
+    def _get_client(self) -> anthropic.Anthropic:
+        """Return the SDK client, creating it on first use so its HTTP pool is reused."""
+        if self._client is None:
+            # Backoff on 429/529 is handled in _request_verse, so disable the SDK's own retries
+            self._client = anthropic.Anthropic(api_key=self.api_key, timeout=self.timeout, max_retries=0)
+        return self._client
 
-        last_content = None
-        last_counts = None
-
-        for attempt in range(1, MAX_RETRIES + 1):
+    def _request_verse(
+        self,
+        client: anthropic.Anthropic,
+        system_prompt: str,
+        messages: list[dict[str, Any]],
+    ) -> str:
+        """Call the Messages API and return the stripped verse, backing off on 429/5xx."""
+        request = {
+            "model": self.model,
+            "max_tokens": 200,
+            "temperature": 1.0,
+            "system": system_prompt,
+            "messages": messages,
+        }
+        for retry in range(HTTP_BACKOFF_MAX_RETRIES + 1):
             try:
-                message = client.messages.create(
-                    model=self.model,
-                    max_tokens=200,
-                    temperature=1.0,
-                    system=system_prompt,
-                    messages=few_shot_messages + [
-                        {"role": "user", "content": user_prompt}
-                    ]
+                if self.stream_responses:
+                    # Leaving the context closes the stream, so a bad line stops generation
+                    with client.messages.stream(**request) as stream:
+                        return _read_streamed_verse(stream.text_stream).strip()
+                message = client.messages.create(**request)
+                break
+            except anthropic.APIStatusError as exc:
+                if exc.status_code not in RETRYABLE_STATUS_CODES or retry == HTTP_BACKOFF_MAX_RETRIES:
+                    raise ThemeAIClientError(f"Anthropic API returned {exc.status_code}") from exc
+                delay = _backoff_delay(retry, exc.response.headers)
+                logger.warning(
+                    f"[Claude] API returned {exc.status_code}; retrying in {delay:.1f}s "
+                    f"({retry + 1}/{HTTP_BACKOFF_MAX_RETRIES})"
                 )
+                time.sleep(delay)
             except Exception as exc:  # pragma: no cover - network failure path
                 raise ThemeAIClientError("Failed to call Anthropic API") from exc
 
-            # Extract text content
-            content = ""
-            for block in message.content:
-                if block.type == "text":
-                    content += block.text
-
-            content = content.strip()
-            is_valid, counts = validate_575(content)
-
-            lines = content.split('\n')
-            lines_detail = " | ".join([f"'{line}' ({count})" for line, count in zip(lines, counts if counts else [])])
-
-            if is_valid:
-                logger.info(f"[Claude] Success on attempt {attempt}: {lines_detail}")
-                return content
-
-            # Not valid, log and retry
-            last_content = content
-            last_counts = counts
-            logger.warning(f"[Claude] Attempt {attempt}/{MAX_RETRIES} failed: expected [5,7,5], got {counts}")
-            logger.warning(f"[Claude] Lines: {lines_detail}")
-
-        # All retries exhausted, return last attempt with warning
-        logger.error(f"[Claude] All {MAX_RETRIES} attempts failed. Using last result with syllables {last_counts}: {last_content}")
-        return last_content or ""
+        # Extract text content
+        content = "".join(block.text for block in message.content if block.type == "text")
+        return content.strip()
 
 
 def resolve_theme_ai_client() -> ThemeAIClient:
@@ -1987,6 +2298,9 @@ def resolve_theme_ai_client() -> ThemeAIClient:
             api_key=api_key,
             model=settings.openai_model,
             timeout=settings.openai_timeout,
+            parallel_attempts=settings.theme_generation_parallel_attempts,
+            hedge_delay_seconds=settings.theme_generation_hedge_delay_seconds,
+            stream_responses=settings.theme_generation_stream_responses,
         )
 
     if provider == "claude":
@@ -1997,6 +2311,9 @@ def resolve_theme_ai_client() -> ThemeAIClient:
             api_key=api_key,
             model=settings.claude_model,
             timeout=settings.claude_timeout,
+            parallel_attempts=settings.theme_generation_parallel_attempts,
+            hedge_delay_seconds=settings.theme_generation_hedge_delay_seconds,
+            stream_responses=settings.theme_generation_stream_responses,
         )
 
     if provider == "gemini":
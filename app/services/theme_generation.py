@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import random
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta, timezone
-from typing import Callable, ContextManager
+from typing import Callable, ContextManager, Iterable, Iterator
 from uuid import uuid4
 
 from sqlalchemy import Select, desc, select
@@ -18,12 +22,35 @@ from app.services.theme_ai_client import ThemeAIClient, ThemeAIClientError, reso
 
 
 PAST_THEMES_DAYS = 30
+# How long a generated-but-unsaved theme may be reused for the same slot
+GENERATED_THEME_CACHE_TTL_SECONDS = 6 * 60 * 60
+# Upper bound for the exponential wait between generation attempts
+RETRY_DELAY_MAX_SECONDS = 120.0
+# Batched requests per run: the full batch plus one smaller retry for its misses
+BATCH_PREFETCH_ROUNDS = 2
+
+# Per-slot locks so concurrent generations of the same (category, date) coalesce.
+# Entries are dropped once no run holds or waits on them, so the map stays small.
+_GENERATION_LOCKS: dict[tuple[str, date], _SlotLock] = {}
+_GENERATION_LOCKS_GUARD = threading.Lock()
+
+# (client type, model, category, date) -> (monotonic expiry, text)
+_GENERATED_THEME_CACHE: dict[tuple[str, str, str, date], tuple[float, str]] = {}
+_GENERATED_THEME_CACHE_LOCK = threading.Lock()
 
 
 class ThemeGenerationError(RuntimeError):
     """Raised when automatic theme generation fails after retries."""
 
 
+@dataclass(slots=True)
+class _SlotLock:
+    """A slot's lock plus the number of runs holding or waiting on it."""
+
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    users: int = 0
+
+
 @dataclass(slots=True)
 class ThemeGenerationResult:
     """Result of generating a theme for a single category."""
@@ -44,37 +71,63 @@ class ThemeGenerationBatchResult:
     missing_categories: list[str]
 
 
-def get_past_themes(
+@dataclass(slots=True)
+class _GenerationContext:
+    """Existing slots and recent history for a run, loaded in one query."""
+
+    existing_by_category: dict[str, tuple[str, bool]]
+    past_by_category: dict[str, list[str]]
+
+
+def _load_generation_context(
     session: Session,
     *,
-    category: str,
+    categories: list[str],
     target_date: date,
     days: int = PAST_THEMES_DAYS,
-) -> list[str]:
-    """Return past theme texts for the given category ordered by newest first."""
+) -> _GenerationContext:
+    """Fetch today's slots and every category's past themes in one round trip.
+
+    ``existing_by_category`` maps a category to its ``(theme id, sponsored)``
+    for ``target_date`` as of this query; ``past_by_category`` holds each
+    category's texts from the previous ``days`` days, newest first.
+    """
 
     start_date = target_date - timedelta(days=days)
-    stmt = (
-        select(Theme.text)
+    rows = session.execute(
+        select(Theme.id, Theme.category, Theme.date, Theme.sponsored, Theme.text)
         .where(
-            Theme.category == category,
+            Theme.category.in_(categories),
             Theme.date >= start_date,
-            Theme.date < target_date,
+            Theme.date <= target_date,
         )
         .order_by(desc(Theme.date))
-    )
-    return list(session.execute(stmt).scalars().all())
+    ).all()
+
+    existing_by_category: dict[str, tuple[str, bool]] = {}
+    past_by_category: dict[str, list[str]] = {category: [] for category in categories}
+    for theme_id, category, theme_date, sponsored, text in rows:
+        if theme_date == target_date:
+            existing_by_category[category] = (theme_id, sponsored)
+        else:
+            past_by_category[category].append(text)
+    return _GenerationContext(existing_by_category, past_by_category)
+
+
+def _normalize_theme_text(text: str) -> str:
+    return text.replace("\n", "").strip()
+
+
+def _normalized_theme_texts(past_themes: Iterable[str]) -> frozenset[str]:
+    """Return the normalised past texts for O(1) duplicate checks."""
+
+    return frozenset(_normalize_theme_text(past) for past in past_themes)
 
 
 def is_duplicate_theme(new_text: str, past_themes: list[str]) -> bool:
     """Return True when the generated text exactly matches a recent theme."""
 
-    normalized_new = new_text.replace("\n", "").strip()
-    for past in past_themes:
-        normalized_past = past.replace("\n", "").strip()
-        if normalized_new == normalized_past:
-            return True
-    return False
+    return _normalize_theme_text(new_text) in _normalized_theme_texts(past_themes)
 
 
 def validate_theme_text(text: str) -> str:
@@ -91,20 +144,125 @@ def validate_theme_text(text: str) -> str:
     return stripped
 
 
+def _theme_cache_key(ai_client: ThemeAIClient, category: str, target_date: date) -> tuple[str, str, str, date]:
+    # Include the model so switching e.g. OPENAI_MODEL does not serve the old model's text
+    model = getattr(ai_client, "model", None) or ""
+    return (type(ai_client).__qualname__, model, category, target_date)
+
+
+def _get_cached_theme(key: tuple[str, str, str, date]) -> str | None:
+    """Return a cached theme text for the slot if it has not expired."""
+
+    with _GENERATED_THEME_CACHE_LOCK:
+        entry = _GENERATED_THEME_CACHE.get(key)
+        if entry is None:
+            return None
+        expires_at, text = entry
+        if expires_at <= time.monotonic():
+            del _GENERATED_THEME_CACHE[key]
+            return None
+        return text
+
+
+def _store_cached_theme(key: tuple[str, str, str, date], text: str) -> None:
+    with _GENERATED_THEME_CACHE_LOCK:
+        _GENERATED_THEME_CACHE[key] = (time.monotonic() + GENERATED_THEME_CACHE_TTL_SECONDS, text)
+
+
+def clear_generated_theme_cache() -> None:
+    """Drop every cached theme text (e.g. before a forced regeneration)."""
+
+    with _GENERATED_THEME_CACHE_LOCK:
+        _GENERATED_THEME_CACHE.clear()
+
+
+def _prefetch_batch_themes(
+    ai_client: ThemeAIClient,
+    *,
+    target_date: date,
+    pending: list[str],
+    past_by_category: dict[str, list[str]],
+) -> None:
+    """Warm the generated-theme cache with one batched request for pending categories.
+
+    Only clients exposing ``generate_batch`` take part. Anything the batch
+    misses (or rejects as a duplicate) is generated per category as usual.
+    """
+
+    generate_batch = getattr(ai_client, "generate_batch", None)
+    if generate_batch is None or not pending:
+        return
+
+    # Each category keeps its own history; generate_batch lists it per section
+    past_by_category = {category: past_by_category[category] for category in pending}
+    covered = 0
+    # One follow-up batch for the categories the first response missed or broke
+    for _ in range(BATCH_PREFETCH_ROUNDS):
+        try:
+            verses = generate_batch(
+                categories=pending,
+                target_date=target_date,
+                past_themes_by_category=past_by_category,
+            )
+        except ThemeAIClientError as exc:
+            logger.warning("Batched theme generation failed, falling back to per-category: %s", exc)
+            break
+
+        for category, raw_text in verses.items():
+            if category not in pending:
+                continue
+            try:
+                text = validate_theme_text(raw_text)
+            except ValueError:
+                continue
+            if is_duplicate_theme(text, past_by_category[category]):
+                continue
+            _store_cached_theme(_theme_cache_key(ai_client, category, target_date), text)
+            pending = [name for name in pending if name != category]
+            covered += 1
+        if not pending:
+            break
+    logger.info("Batched theme generation covered %d/%d categories", covered, len(past_by_category))
+
+
+def _retry_delay(base_seconds: float, attempt: int) -> float:
+    """Return the jittered exponential wait after failed ``attempt`` (1-based)."""
+
+    if base_seconds <= 0:
+        return 0.0
+    delay = min(RETRY_DELAY_MAX_SECONDS, base_seconds * 2 ** (attempt - 1))
+    return delay * random.uniform(0.5, 1.5)
+
+
 def generate_with_retry(
     ai_client: ThemeAIClient,
     *,
     category: str,
     target_date: date,
     past_themes: list[str] | None = None,
+    use_cache: bool = True,
 ) -> str:
-    """Generate a theme text using the configured retry strategy."""
+    """Generate a theme text using the configured retry strategy.
+
+    A text generated earlier for the same client type and slot is reused when
+    ``use_cache`` is set, so a run that failed after generation (for example
+    while saving) does not pay for another AI round trip.
+    """
 
     settings = get_settings()
     max_attempts = settings.theme_generation_max_retries
     delay_seconds = settings.theme_generation_retry_delay_seconds
     last_error: Exception | None = None
     past_list = past_themes or []
+    # Normalised once: the retry loop checks every candidate against it
+    normalized_past = _normalized_theme_texts(past_list)
+
+    cache_key = _theme_cache_key(ai_client, category, target_date)
+    if use_cache:
+        cached_text = _get_cached_theme(cache_key)
+        if cached_text is not None and _normalize_theme_text(cached_text) not in normalized_past:
+            logger.info(f"Reusing cached theme for '{category}' on {target_date}")
+            return cached_text
 
     for attempt in range(1, max_attempts + 1):
         try:
@@ -115,7 +273,7 @@ def generate_with_retry(
             )
             validated_text = validate_theme_text(raw_text)
 
-            if is_duplicate_theme(validated_text, past_list):
+            if _normalize_theme_text(validated_text) in normalized_past:
                 logger.warning(
                     f"Generated theme is duplicate (attempt {attempt}/{max_attempts}): "
                     f"'{validated_text[:30]}...'"
@@ -125,9 +283,10 @@ def generate_with_retry(
                         f"All generated themes for '{category}' were duplicates"
                     )
                 if delay_seconds > 0:
-                    time.sleep(delay_seconds)
+                    time.sleep(_retry_delay(delay_seconds, attempt))
                 continue
 
+            _store_cached_theme(cache_key, validated_text)
             return validated_text
         except (ThemeAIClientError, ValueError) as exc:
             last_error = exc
@@ -137,7 +296,7 @@ def generate_with_retry(
             if attempt >= max_attempts:
                 break
             if delay_seconds > 0:
-                time.sleep(delay_seconds)
+                time.sleep(_retry_delay(delay_seconds, attempt))
 
     error = ThemeGenerationError(
         f"Failed to generate theme for category '{category}' after {max_attempts} attempts"
@@ -219,6 +378,26 @@ def get_missing_categories(
     return [category for category in categories if category not in existing_categories]
 
 
+@contextmanager
+def _generation_lock(category: str, target_date: date) -> Iterator[None]:
+    """Hold the process-wide lock guarding generation for one theme slot."""
+
+    key = (category, target_date)
+    with _GENERATION_LOCKS_GUARD:
+        slot_lock = _GENERATION_LOCKS.get(key)
+        if slot_lock is None:
+            slot_lock = _GENERATION_LOCKS[key] = _SlotLock()
+        slot_lock.users += 1
+    try:
+        with slot_lock.lock:
+            yield
+    finally:
+        with _GENERATION_LOCKS_GUARD:
+            slot_lock.users -= 1
+            if slot_lock.users == 0:
+                del _GENERATION_LOCKS[key]
+
+
 def _ordered_unique(categories: list[str], allowed_order: list[str]) -> list[str]:
     """Return unique category names preserving configured order."""
 
@@ -244,94 +423,108 @@ def generate_all_categories(
     resolved_date = target_date or datetime.now(settings.timezone).date()
 
     client = ai_client or resolve_theme_ai_client()
+    with create_session() as session:
+        context = _load_generation_context(
+            session,
+            categories=categories,
+            target_date=resolved_date,
+        )
+
+    if settings.theme_generation_batch_categories and not overwrite_existing_ai:
+        # Per-category generation below picks the batched verses up from the cache
+        _prefetch_batch_themes(
+            client,
+            target_date=resolved_date,
+            pending=[category for category in categories if category not in context.existing_by_category],
+            past_by_category=context.past_by_category,
+        )
+
     results: list[ThemeGenerationResult] = []
     skipped_categories: list[str] = []
     failed_categories: list[str] = []
 
-    for category in categories:
+    def _process_category(category: str) -> None:
         logger.info(f"Processing theme generation for category: {category}")
 
-        past_themes: list[str] = []
-        should_skip = False
-        existing_id: str | None = None
-
-        with create_session() as session:
-            existing = session.execute(
-                select(Theme).where(
-                    Theme.category == category,
-                    Theme.date == resolved_date,
-                )
-            ).scalars().first()
-
-            if existing:
-                existing_id = existing.id
-                if existing.sponsored:
-                    logger.info(
-                        f"Skipping {category} on {resolved_date}: sponsor theme exists"
+        # Serialise work on the same slot so concurrent runs in this process
+        # share one AI round trip instead of racing each other. The slot is
+        # re-read under the lock: an earlier holder may have just saved it.
+        with _generation_lock(category, resolved_date):
+            with create_session() as session:
+                existing = session.execute(
+                    select(Theme.id, Theme.sponsored).where(
+                        Theme.category == category,
+                        Theme.date == resolved_date,
                     )
+                ).first()
+            existing_id = existing.id if existing else None
+            if existing is not None:
+                if existing.sponsored:
+                    logger.info(f"Skipping {category} on {resolved_date}: sponsor theme exists")
                     skipped_categories.append(category)
-                    should_skip = True
-                elif not overwrite_existing_ai:
-                    logger.info(
-                        f"Skipping {category} on {resolved_date}: AI theme already exists"
-                    )
+                    return
+                if not overwrite_existing_ai:
+                    logger.info(f"Skipping {category} on {resolved_date}: AI theme already exists")
                     skipped_categories.append(category)
-                    should_skip = True
-
-            if not should_skip:
-                past_themes = get_past_themes(
-                    session,
-                    category=category,
-                    target_date=resolved_date,
-                )
-                logger.info(
-                    f"Loaded {len(past_themes)} past themes for category '{category}' "
-                    f"(last {PAST_THEMES_DAYS} days)"
-                )
+                    return
 
-        if should_skip:
-            continue
-
-        try:
-            text = generate_with_retry(
-                client,
-                category=category,
-                target_date=resolved_date,
-                past_themes=past_themes,
+            past_themes = context.past_by_category[category]
+            logger.info(
+                f"Loaded {len(past_themes)} past themes for category '{category}' "
+                f"(last {PAST_THEMES_DAYS} days)"
             )
-        except Exception as exc:
-            logger.error(f"Failed to generate theme for {category}: {exc}")
-            failed_categories.append(category)
-            continue
 
-        with create_session() as session:
             try:
-                theme = upsert_theme(
-                    session,
+                text = generate_with_retry(
+                    client,
                     category=category,
                     target_date=resolved_date,
-                    text=text,
-                    overwrite_existing_ai=overwrite_existing_ai,
+                    past_themes=past_themes,
+                    use_cache=not overwrite_existing_ai,
                 )
-                if theme is None:
-                    session.rollback()
-                    skipped_categories.append(category)
-                    continue
+            except Exception as exc:
+                logger.error(f"Failed to generate theme for {category}: {exc}")
+                failed_categories.append(category)
+                return
 
-                session.commit()
-                results.append(
-                    ThemeGenerationResult(
+            with create_session() as session:
+                try:
+                    theme = upsert_theme(
+                        session,
                         category=category,
-                        theme=theme,
-                        generated_text=text,
-                        was_created=existing_id is None,
+                        target_date=resolved_date,
+                        text=text,
+                        overwrite_existing_ai=overwrite_existing_ai,
                     )
-                )
-                logger.info(f"Successfully saved theme for {category}")
-            except Exception as exc:
-                logger.error(f"Failed to save theme for {category}: {exc}")
-                failed_categories.append(category)
-                session.rollback()
+                    if theme is None:
+                        session.rollback()
+                        skipped_categories.append(category)
+                        return
+
+                    session.commit()
+                    results.append(
+                        ThemeGenerationResult(
+                            category=category,
+                            theme=theme,
+                            generated_text=text,
+                            was_created=existing_id is None,
+                        )
+                    )
+                    logger.info(f"Successfully saved theme for {category}")
+                except Exception as exc:
+                    logger.error(f"Failed to save theme for {category}: {exc}")
+                    failed_categories.append(category)
+                    session.rollback()
+
+    workers = min(settings.theme_generation_category_workers, len(categories))
+    if workers > 1:
+        # Categories are independent slots, so their AI round trips can overlap
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="theme-gen") as executor:
+            list(executor.map(_process_category, categories))
+        results.sort(key=lambda result: categories.index(result.category))
+    else:
+        for category in categories:
+            _process_category(category)
 
     with create_session() as session:
         missing_categories = get_missing_categories(
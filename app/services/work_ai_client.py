@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import logging
 import re
 from dataclasses import dataclass
 from typing import Protocol
 
 import anthropic
+import orjson
 import requests
 
 from app.core.config import get_settings
+from app.core.http import get_http_session
+from app.core.logging import logger
 from app.services.theme_ai_client import count_syllables
 
 
@@ -40,6 +44,11 @@ def validate_77(text: str) -> tuple[bool, list[int]]:
     return is_valid, counts
 
 
+def _format_lines_detail(text: str, counts: list[int]) -> str:
+    """Return a "'line' (count) | ..." summary for log messages."""
+    return " | ".join(f"'{line}' ({count})" for line, count in zip(text.split('\n'), counts))
+
+
 class WorkAIClient(Protocol):
     """Protocol describing work (lower verse) generation clients."""
 
@@ -127,7 +136,7 @@ class OpenAIWorkClient(WorkAIClient):
 
         for attempt in range(1, MAX_RETRIES + 1):
             try:
-                response = requests.post(self.endpoint, json=payload, headers=headers, timeout=self.timeout)
+                response = get_http_session().post(self.endpoint, json=payload, headers=headers, timeout=self.timeout)
             except requests.RequestException as exc:
                 raise WorkAIClientError("Failed to call OpenAI completions endpoint") from exc
 
@@ -137,7 +146,7 @@ class OpenAIWorkClient(WorkAIClient):
                 raise WorkAIClientError(f"OpenAI API returned {response.status_code}") from exc
 
             try:
-                payload_json = response.json()
+                payload_json = orjson.loads(response.content)
             except ValueError as exc:
                 raise WorkAIClientError("OpenAI API returned invalid JSON") from exc
 
@@ -149,21 +158,25 @@ class OpenAIWorkClient(WorkAIClient):
             content = content.strip()
             is_valid, counts = validate_77(content)
 
-            lines = content.split('\n')
-            lines_detail = " | ".join([f"'{line}' ({count})" for line, count in zip(lines, counts if counts else [])])
-
             if is_valid:
-                print(f"[Work generation] [OK] Success on attempt {attempt}: {lines_detail}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("[Work generation] Success on attempt %d: %s", attempt, _format_lines_detail(content, counts))
                 return content
 
             # Not valid, log and retry
             last_content = content
             last_counts = counts
-            print(f"[Work generation] [FAIL] Attempt {attempt}/{MAX_RETRIES} failed: expected [7,7], got {counts}")
-            print(f"[Work generation]    Lines: {lines_detail}")
+            logger.warning("[Work generation] Attempt %d/%d failed: expected [7,7], got %s", attempt, MAX_RETRIES, counts)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[Work generation] Lines: %s", _format_lines_detail(content, counts))
 
         # All retries exhausted, return last attempt with warning
-        print(f"[Work generation] WARNING: All {MAX_RETRIES} attempts failed. Using last result with syllables {last_counts}: {last_content}")
+        logger.error(
+            "[Work generation] All %d attempts failed. Using last result with syllables %s: %s",
+            MAX_RETRIES,
+            last_counts,
+            last_content,
+        )
         return last_content or ""
 
 
@@ -255,10 +268,10 @@ class XAIWorkClient(WorkAIClient):
 
         for attempt in range(1, MAX_RETRIES + 1):
             try:
-                response = requests.post(self.endpoint, json=payload, headers=headers, timeout=self.timeout)
+                response = get_http_session().post(self.endpoint, json=payload, headers=headers, timeout=self.timeout)
             except requests.RequestException as exc:
                 last_error = f"Network error: {exc}"
-                print(f"[Work generation] [FAIL] Attempt {attempt}/{MAX_RETRIES} - Network error: {exc}")
+                logger.warning("[Work generation] Attempt %d/%d - Network error: %s", attempt, MAX_RETRIES, exc)
                 if attempt == MAX_RETRIES:
                     raise WorkAIClientError(f"Failed to call X.ai API endpoint after {MAX_RETRIES} attempts: {exc}") from exc
                 continue
@@ -267,16 +280,16 @@ class XAIWorkClient(WorkAIClient):
                 response.raise_for_status()
             except requests.HTTPError as exc:
                 last_error = f"HTTP {response.status_code}: {response.text[:200]}"
-                print(f"[Work generation] [FAIL] Attempt {attempt}/{MAX_RETRIES} - HTTP error: {response.status_code}")
+                logger.warning("[Work generation] Attempt %d/%d - HTTP error: %s", attempt, MAX_RETRIES, response.status_code)
                 if attempt == MAX_RETRIES:
                     raise WorkAIClientError(f"X.ai API returned {response.status_code}") from exc
                 continue
 
             try:
-                payload_json = response.json()
+                payload_json = orjson.loads(response.content)
             except ValueError as exc:
                 last_error = f"Invalid JSON: {exc}"
-                print(f"[Work generation] [FAIL] Attempt {attempt}/{MAX_RETRIES} - Invalid JSON response")
+                logger.warning("[Work generation] Attempt %d/%d - Invalid JSON response", attempt, MAX_RETRIES)
                 if attempt == MAX_RETRIES:
                     raise WorkAIClientError("X.ai API returned invalid JSON") from exc
                 continue
@@ -285,7 +298,7 @@ class XAIWorkClient(WorkAIClient):
                 content = payload_json["choices"][0]["message"]["content"]
             except (KeyError, IndexError, TypeError) as exc:
                 last_error = f"Missing content: {exc}"
-                print(f"[Work generation] [FAIL] Attempt {attempt}/{MAX_RETRIES} - Missing message content")
+                logger.warning("[Work generation] Attempt %d/%d - Missing message content", attempt, MAX_RETRIES)
                 if attempt == MAX_RETRIES:
                     raise WorkAIClientError("X.ai API response missing message content") from exc
                 continue
@@ -293,21 +306,25 @@ class XAIWorkClient(WorkAIClient):
             content = content.strip()
             is_valid, counts = validate_77(content)
 
-            lines = content.split('\n')
-            lines_detail = " | ".join([f"'{line}' ({count})" for line, count in zip(lines, counts if counts else [])])
-
             if is_valid:
-                print(f"[Work generation] [OK] Success on attempt {attempt}: {lines_detail}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("[Work generation] Success on attempt %d: %s", attempt, _format_lines_detail(content, counts))
                 return content
 
             # Not valid, log and retry
             last_content = content
             last_counts = counts
-            print(f"[Work generation] [FAIL] Attempt {attempt}/{MAX_RETRIES} failed: expected [7,7], got {counts}")
-            print(f"[Work generation]    Lines: {lines_detail}")
+            logger.warning("[Work generation] Attempt %d/%d failed: expected [7,7], got %s", attempt, MAX_RETRIES, counts)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[Work generation] Lines: %s", _format_lines_detail(content, counts))
 
         # All retries exhausted, return last attempt with warning
-        print(f"[Work generation] WARNING: All {MAX_RETRIES} attempts failed. Using last result with syllables {last_counts}: {last_content}")
+        logger.error(
+            "[Work generation] All %d attempts failed. Using last result with syllables %s: %s",
+            MAX_RETRIES,
+            last_counts,
+            last_content,
+        )
         return last_content or ""
 
 
@@ -387,9 +404,9 @@ class PLaMoWorkClient(WorkAIClient):
         }
 
         try:
-            response = requests.post(self.endpoint, json=payload, headers=headers, timeout=self.timeout)
+            response = get_http_session().post(self.endpoint, json=payload, headers=headers, timeout=self.timeout)
             response.raise_for_status()
-            payload_json = response.json()
+            payload_json = orjson.loads(response.content)
             content = payload_json["choices"][0]["message"]["content"]
             return content.strip()
         except (requests.RequestException, requests.HTTPError, ValueError, KeyError, IndexError, TypeError) as exc:
@@ -462,9 +479,9 @@ class PLaMoWorkClient(WorkAIClient):
         }
 
         try:
-            response = requests.post(self.xai_endpoint, json=payload, headers=headers, timeout=self.xai_timeout)
+            response = get_http_session().post(self.xai_endpoint, json=payload, headers=headers, timeout=self.xai_timeout)
             response.raise_for_status()
-            payload_json = response.json()
+            payload_json = orjson.loads(response.content)
             content = payload_json["choices"][0]["message"]["content"]
             return content.strip()
         except (requests.RequestException, requests.HTTPError, ValueError, KeyError, IndexError, TypeError) as exc:
@@ -490,9 +507,9 @@ class PLaMoWorkClient(WorkAIClient):
                         category=category,
                         persona=persona,
                     )
-                    print(f"[Work generation] [PLaMo ideation] attempt={attempt}, ideas={ideas[:150]!r}")
+                    logger.info("[Work generation] [PLaMo ideation] attempt=%d, ideas=%r", attempt, ideas[:150])
                 except WorkAIClientError as exc:
-                    print(f"[Work generation] [FAIL] PLaMo ideation failed: {exc}")
+                    logger.warning("[Work generation] PLaMo ideation failed: %s", exc)
                     ideas = None
                     if attempt == MAX_RETRIES:
                         raise
@@ -511,25 +528,30 @@ class PLaMoWorkClient(WorkAIClient):
                     persona=persona,
                 )
             except WorkAIClientError as exc:
-                print(f"[Work generation] [FAIL] Attempt {attempt}/{MAX_RETRIES} - XAI compose: {exc}")
+                logger.warning("[Work generation] Attempt %d/%d - XAI compose: %s", attempt, MAX_RETRIES, exc)
                 if attempt == MAX_RETRIES:
                     raise
                 continue
 
             is_valid, counts = validate_77(content)
-            lines = content.split('\n')
-            lines_detail = " | ".join([f"'{line}' ({count})" for line, count in zip(lines, counts if counts else [])])
 
             if is_valid:
-                print(f"[Work generation] [OK] Success on attempt {attempt}: {lines_detail}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("[Work generation] Success on attempt %d: %s", attempt, _format_lines_detail(content, counts))
                 return content
 
             last_content = content
             last_counts = counts
-            print(f"[Work generation] [FAIL] Attempt {attempt}/{MAX_RETRIES} failed: expected [7,7], got {counts}")
-            print(f"[Work generation]    Lines: {lines_detail}")
-
-        print(f"[Work generation] WARNING: All {MAX_RETRIES} attempts failed. Using last result with syllables {last_counts}: {last_content}")
+            logger.warning("[Work generation] Attempt %d/%d failed: expected [7,7], got %s", attempt, MAX_RETRIES, counts)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[Work generation] Lines: %s", _format_lines_detail(content, counts))
+
+        logger.error(
+            "[Work generation] All %d attempts failed. Using last result with syllables %s: %s",
+            MAX_RETRIES,
+            last_counts,
+            last_content,
+        )
         return last_content or ""
 
 
@@ -618,9 +640,9 @@ class GeminiWorkClient(WorkAIClient):
 
         for attempt in range(1, MAX_RETRIES + 1):
             try:
-                response = requests.post(self.endpoint, json=payload, headers=headers, timeout=self.timeout)
+                response = get_http_session().post(self.endpoint, json=payload, headers=headers, timeout=self.timeout)
             except requests.RequestException as exc:
-                print(f"[Work generation] [FAIL] Attempt {attempt}/{MAX_RETRIES} - Network error: {exc}")
+                logger.warning("[Work generation] Attempt %d/%d - Network error: %s", attempt, MAX_RETRIES, exc)
                 if attempt == MAX_RETRIES:
                     raise WorkAIClientError(f"Failed to call Gemini API endpoint after {MAX_RETRIES} attempts: {exc}") from exc
                 continue
@@ -628,15 +650,15 @@ class GeminiWorkClient(WorkAIClient):
             try:
                 response.raise_for_status()
             except requests.HTTPError as exc:
-                print(f"[Work generation] [FAIL] Attempt {attempt}/{MAX_RETRIES} - HTTP error: {response.status_code}")
+                logger.warning("[Work generation] Attempt %d/%d - HTTP error: %s", attempt, MAX_RETRIES, response.status_code)
                 if attempt == MAX_RETRIES:
                     raise WorkAIClientError(f"Gemini API returned {response.status_code}") from exc
                 continue
 
             try:
-                payload_json = response.json()
+                payload_json = orjson.loads(response.content)
             except ValueError as exc:
-                print(f"[Work generation] [FAIL] Attempt {attempt}/{MAX_RETRIES} - Invalid JSON response")
+                logger.warning("[Work generation] Attempt %d/%d - Invalid JSON response", attempt, MAX_RETRIES)
                 if attempt == MAX_RETRIES:
                     raise WorkAIClientError("Gemini API returned invalid JSON") from exc
                 continue
@@ -644,7 +666,7 @@ class GeminiWorkClient(WorkAIClient):
             try:
                 content = payload_json["choices"][0]["message"]["content"]
             except (KeyError, IndexError, TypeError) as exc:
-                print(f"[Work generation] [FAIL] Attempt {attempt}/{MAX_RETRIES} - Missing message content")
+                logger.warning("[Work generation] Attempt %d/%d - Missing message content", attempt, MAX_RETRIES)
                 if attempt == MAX_RETRIES:
                     raise WorkAIClientError("Gemini API response missing message content") from exc
                 continue
@@ -652,19 +674,23 @@ class GeminiWorkClient(WorkAIClient):
             content = content.strip()
             is_valid, counts = validate_77(content)
 
-            lines = content.split('\n')
-            lines_detail = " | ".join([f"'{line}' ({count})" for line, count in zip(lines, counts if counts else [])])
-
             if is_valid:
-                print(f"[Work generation] [OK] Success on attempt {attempt}: {lines_detail}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("[Work generation] Success on attempt %d: %s", attempt, _format_lines_detail(content, counts))
                 return content
 
             last_content = content
             last_counts = counts
-            print(f"[Work generation] [FAIL] Attempt {attempt}/{MAX_RETRIES} failed: expected [7,7], got {counts}")
-            print(f"[Work generation]    Lines: {lines_detail}")
-
-        print(f"[Work generation] WARNING: All {MAX_RETRIES} attempts failed. Using last result with syllables {last_counts}: {last_content}")
+            logger.warning("[Work generation] Attempt %d/%d failed: expected [7,7], got %s", attempt, MAX_RETRIES, counts)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[Work generation] Lines: %s", _format_lines_detail(content, counts))
+
+        logger.error(
+            "[Work generation] All %d attempts failed. Using last result with syllables %s: %s",
+            MAX_RETRIES,
+            last_counts,
+            last_content,
+        )
         return last_content or ""
 
 
@@ -753,21 +779,25 @@ class ClaudeWorkClient(WorkAIClient):
             content = content.strip()
             is_valid, counts = validate_77(content)
 
-            lines = content.split('\n')
-            lines_detail = " | ".join([f"'{line}' ({count})" for line, count in zip(lines, counts if counts else [])])
-
             if is_valid:
-                print(f"[Work generation] [OK] Success on attempt {attempt}: {lines_detail}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("[Work generation] Success on attempt %d: %s", attempt, _format_lines_detail(content, counts))
                 return content
 
             # Not valid, log and retry
             last_content = content
             last_counts = counts
-            print(f"[Work generation] [FAIL] Attempt {attempt}/{MAX_RETRIES} failed: expected [7,7], got {counts}")
-            print(f"[Work generation]    Lines: {lines_detail}")
+            logger.warning("[Work generation] Attempt %d/%d failed: expected [7,7], got %s", attempt, MAX_RETRIES, counts)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[Work generation] Lines: %s", _format_lines_detail(content, counts))
 
         # All retries exhausted, return last attempt with warning
-        print(f"[Work generation] WARNING: All {MAX_RETRIES} attempts failed. Using last result with syllables {last_counts}: {last_content}")
+        logger.error(
+            "[Work generation] All %d attempts failed. Using last result with syllables %s: %s",
+            MAX_RETRIES,
+            last_counts,
+            last_content,
+        )
         return last_content or ""
 
 
@@ -172,7 +172,7 @@ def main() -> None:
 
         print(f"\n  生成候補 ({gen_time:.1f}s):")
         for i, c in enumerate(raw_candidates):
-            is_valid, counts = validate_575(c.text)
+            is_valid, counts, _ = validate_575(c.text)
             status = "5-7-5 OK" if is_valid else f"NG {counts}"
             mark = " " if c in filtered else "x"
             lines = c.text.replace("\n", " / ")
@@ -195,7 +195,7 @@ def main() -> None:
             print(f"  [判定ERROR] ({judge_time:.1f}s) {exc}\n")
             # fallback
             for c in filtered:
-                v, cts = validate_575(c.text)
+                v, cts, _ = validate_575(c.text)
                 if v:
                     print(f"  → フォールバック選択:")
                     for line in c.text.split("\n"):
@@ -206,7 +206,7 @@ def main() -> None:
         judge_time = time.time() - judge_start
 
         selected = next(c for c in filtered if c.index == result.selected_index)
-        is_valid, counts = validate_575(selected.text)
+        is_valid, counts, _ = validate_575(selected.text)
 
         print(f"\n  Gemini Judge 判定 ({judge_time:.1f}s):")
         print(f"    選択: 候補{result.selected_index}")
@@ -6,8 +6,10 @@ import logging
 from datetime import date
 from types import SimpleNamespace
 
+import orjson
 import pytest
 
+from app.core.http import get_http_session
 from app.services.theme_ai_client import (
     PLaMoThemeClient,
     ThemeAIClientError,
@@ -25,7 +27,7 @@ from app.services.work_ai_client import (
 # ---------------------------------------------------------------------------
 
 def _make_router(plamo_content: str, xai_content: str, judge_payload: dict | None = None):
-    """Return a fake requests.post that routes by URL."""
+    """Return a fake session post that routes by URL."""
 
     def fake_post(url, *args, **kwargs):
         if "preferredai" in url:
@@ -39,6 +41,7 @@ def _make_router(plamo_content: str, xai_content: str, judge_payload: dict | Non
         return SimpleNamespace(
             status_code=200,
             json=lambda payload=payload: payload,
+            content=orjson.dumps(payload),
             raise_for_status=lambda: None,
         )
 
@@ -77,7 +80,7 @@ def test_plamo_theme_client_pipeline_with_judge(
     }
 
     fake_post = _make_router(plamo_ideas, xai_candidates, judge_payload)
-    monkeypatch.setattr("app.services.theme_ai_client.requests.post", fake_post)
+    monkeypatch.setattr(get_http_session(), "post", fake_post)
 
     client = PLaMoThemeClient(
         api_key="plamo-key",
@@ -114,7 +117,7 @@ def test_plamo_theme_client_falls_back_when_judge_fails(
     judge_payload = {"output_text": "not json"}
 
     fake_post = _make_router(plamo_ideas, xai_candidates, judge_payload)
-    monkeypatch.setattr("app.services.theme_ai_client.requests.post", fake_post)
+    monkeypatch.setattr(get_http_session(), "post", fake_post)
 
     client = PLaMoThemeClient(
         api_key="plamo-key",
@@ -158,10 +161,11 @@ def test_plamo_theme_client_raises_on_all_invalid_xai_candidates(
         return SimpleNamespace(
             status_code=200,
             json=lambda content=content: {"choices": [{"message": {"content": content}}]},
+            content=orjson.dumps({"choices": [{"message": {"content": content}}]}),
             raise_for_status=lambda: None,
         )
 
-    monkeypatch.setattr("app.services.theme_ai_client.requests.post", fake_post)
+    monkeypatch.setattr(get_http_session(), "post", fake_post)
 
     client = PLaMoThemeClient(
         api_key="plamo-key",
@@ -182,10 +186,11 @@ def test_plamo_theme_client_raises_on_bad_plamo_payload(
         return SimpleNamespace(
             status_code=200,
             json=lambda: {},
+            content=orjson.dumps({}),
             raise_for_status=lambda: None,
         )
 
-    monkeypatch.setattr("app.services.theme_ai_client.requests.post", fake_post)
+    monkeypatch.setattr(get_http_session(), "post", fake_post)
     client = PLaMoThemeClient(
         api_key="plamo-key",
         xai_api_key="xai-key",
@@ -253,7 +258,7 @@ def test_plamo_work_client_pipeline_success(
     xai_verse = "あなたの声が\n聞こえなくなる"
 
     fake_post = _make_router(plamo_ideas, xai_verse)
-    monkeypatch.setattr("app.services.work_ai_client.requests.post", fake_post)
+    monkeypatch.setattr(get_http_session(), "post", fake_post)
 
     client = PLaMoWorkClient(
         api_key="plamo-key",
@@ -289,10 +294,11 @@ def test_plamo_work_client_retries_on_invalid_mora(
         return SimpleNamespace(
             status_code=200,
             json=lambda content=content: {"choices": [{"message": {"content": content}}]},
+            content=orjson.dumps({"choices": [{"message": {"content": content}}]}),
             raise_for_status=lambda: None,
         )
 
-    monkeypatch.setattr("app.services.work_ai_client.requests.post", fake_post)
+    monkeypatch.setattr(get_http_session(), "post", fake_post)
 
     client = PLaMoWorkClient(
         api_key="plamo-key",
@@ -320,10 +326,11 @@ def test_plamo_work_client_raises_on_bad_payload(
         return SimpleNamespace(
             status_code=200,
             json=lambda: {},
+            content=orjson.dumps({}),
             raise_for_status=lambda: None,
         )
 
-    monkeypatch.setattr("app.services.work_ai_client.requests.post", fake_post)
+    monkeypatch.setattr(get_http_session(), "post", fake_post)
     client = PLaMoWorkClient(
         api_key="plamo-key",
         timeout=5.0,
@@ -354,10 +361,11 @@ def test_plamo_work_client_uses_persona(
         return SimpleNamespace(
             status_code=200,
             json=lambda content=content: {"choices": [{"message": {"content": content}}]},
+            content=orjson.dumps({"choices": [{"message": {"content": content}}]}),
             raise_for_status=lambda: None,
         )
 
-    monkeypatch.setattr("app.services.work_ai_client.requests.post", fake_post)
+    monkeypatch.setattr(get_http_session(), "post", fake_post)
 
     client = PLaMoWorkClient(
         api_key="plamo-key",
@@ -3,20 +3,27 @@
 from __future__ import annotations
 
 import logging
+import threading
 from datetime import date
 from types import SimpleNamespace
 
+import orjson
 import pytest
+import requests
 
+from app.core.http import get_http_session
 from app.services.theme_ai_client import (
+    THEME_FEW_SHOT_MESSAGES,
+    ClaudeThemeClient,
     DummyThemeAIClient,
-    OpenAIThemeJudge,
     OpenAIThemeClient,
+    OpenAIThemeJudge,
     ThemeAIClientError,
     XAIThemeClient,
     _filter_xai_candidates,
     _split_xai_candidates,
     resolve_theme_ai_client,
+    validate_575,
 )
 
 
@@ -27,6 +34,18 @@ def test_dummy_theme_ai_client_returns_placeholder() -> None:
     assert "nature" in result
 
 
+def test_validate_575_rejects_overlong_text_without_counting(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail_count(_line: str) -> int:
+        raise AssertionError("count_syllables should not be called")
+
+    monkeypatch.setattr("app.services.theme_ai_client.count_syllables", fail_count)
+
+    is_valid, counts, lines = validate_575("あ" * 30 + "\n" + "い" * 30 + "\n" + "う" * 30)
+    assert is_valid is False
+    assert counts == []
+    assert len(lines) == 3
+
+
 def test_openai_theme_client_parses_response(monkeypatch: pytest.MonkeyPatch) -> None:
     payload = {
         "choices": [
@@ -40,10 +59,11 @@ def test_openai_theme_client_parses_response(monkeypatch: pytest.MonkeyPatch) ->
         return SimpleNamespace(
             status_code=200,
             json=lambda: payload,
+            content=orjson.dumps(payload),
             raise_for_status=lambda: None,
         )
 
-    monkeypatch.setattr("app.services.theme_ai_client.requests.post", fake_post)
+    monkeypatch.setattr(get_http_session(), "post", fake_post)
 
     client = OpenAIThemeClient(api_key="test-key", model="gpt-test", timeout=5.0)
     verse = client.generate(category="season", target_date=date(2025, 1, 11))
@@ -56,16 +76,309 @@ def test_openai_theme_client_raises_on_bad_payload(monkeypatch: pytest.MonkeyPat
         return SimpleNamespace(
             status_code=200,
             json=lambda: {},
+            content=orjson.dumps({}),
             raise_for_status=lambda: None,
         )
 
-    monkeypatch.setattr("app.services.theme_ai_client.requests.post", fake_post)
+    monkeypatch.setattr(get_http_session(), "post", fake_post)
     client = OpenAIThemeClient(api_key="test-key")
 
     with pytest.raises(ThemeAIClientError):
         client.generate(category="emotion", target_date=date(2025, 1, 12))
 
 
+def test_openai_theme_client_parallel_attempts_return_first_valid_verse(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    verses = iter(["春の朝\n窓をあけたら\n風つよいよ", "すれ違う\nいつもの駅で\nまた会えた"])
+    lock = threading.Lock()
+
+    def fake_post(*args, **kwargs):
+        with lock:
+            content = next(verses, "春の朝\n窓をあけたら\n風つよいよ")
+        return SimpleNamespace(
+            status_code=200,
+            json=lambda: {"choices": [{"message": {"content": content}}]},
+            content=orjson.dumps({"choices": [{"message": {"content": content}}]}),
+            raise_for_status=lambda: None,
+        )
+
+    monkeypatch.setattr(get_http_session(), "post", fake_post)
+
+    client = OpenAIThemeClient(api_key="test-key", parallel_attempts=3)
+    verse = client.generate(category="恋愛", target_date=date(2025, 1, 11))
+    assert verse == "すれ違う\nいつもの駅で\nまた会えた"
+
+
+def test_openai_theme_client_hedged_attempts_skip_extra_requests_when_first_is_fast(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[str] = []
+    payload = {"choices": [{"message": {"content": "すれ違う\nいつもの駅で\nまた会えた"}}]}
+
+    def fake_post(url, *args, **kwargs):
+        calls.append(url)
+        return SimpleNamespace(
+            status_code=200,
+            content=orjson.dumps(payload),
+            raise_for_status=lambda: None,
+        )
+
+    monkeypatch.setattr(get_http_session(), "post", fake_post)
+
+    client = OpenAIThemeClient(api_key="test-key", parallel_attempts=3, hedge_delay_seconds=5.0)
+    verse = client.generate(category="恋愛", target_date=date(2025, 1, 11))
+
+    assert verse == "すれ違う\nいつもの駅で\nまた会えた"
+    assert len(calls) == 1
+
+
+def _sse_response(deltas: list[str], consumed: list[str]) -> SimpleNamespace:
+    def iter_lines():
+        for delta in deltas:
+            consumed.append(delta)
+            yield b"data: " + orjson.dumps({"choices": [{"delta": {"content": delta}}]})
+        yield b"data: [DONE]"
+
+    closed: list[bool] = []
+    return SimpleNamespace(
+        status_code=200,
+        raise_for_status=lambda: None,
+        iter_lines=iter_lines,
+        close=lambda: closed.append(True),
+        closed=closed,
+    )
+
+
+def test_openai_theme_client_streaming_aborts_on_first_bad_line(monkeypatch: pytest.MonkeyPatch) -> None:
+    consumed: list[str] = []
+    bodies: list[dict] = []
+    streams = [
+        _sse_response(["ながいながい", "いちぎょうめ\n", "いつもの駅で\n", "また会えた"], consumed),
+        _sse_response(["すれ違う\n", "いつもの駅で\n", "また会えた"], consumed),
+    ]
+    responses = iter(streams)
+
+    def fake_post(url, *args, **kwargs):
+        assert kwargs["stream"] is True
+        bodies.append(orjson.loads(kwargs["data"]))
+        return next(responses)
+
+    monkeypatch.setattr(get_http_session(), "post", fake_post)
+
+    client = OpenAIThemeClient(api_key="test-key", stream_responses=True)
+    verse = client.generate(category="恋愛", target_date=date(2025, 1, 10))
+
+    assert verse == "すれ違う\nいつもの駅で\nまた会えた"
+    assert bodies[0]["stream"] is True
+    # The first stream is abandoned right after its 12-mora first line
+    assert consumed[:2] == ["ながいながい", "いちぎょうめ\n"]
+    assert consumed[2:] == ["すれ違う\n", "いつもの駅で\n", "また会えた"]
+    assert streams[0].closed == [True]
+
+
+def test_openai_theme_client_streaming_stops_after_third_valid_line(monkeypatch: pytest.MonkeyPatch) -> None:
+    consumed: list[str] = []
+    stream = _sse_response(["すれ違う\n", "いつもの駅で\n", "また会えた\n", "（解説）", "駅での再会"], consumed)
+    monkeypatch.setattr(get_http_session(), "post", lambda url, *args, **kwargs: stream)
+
+    client = OpenAIThemeClient(api_key="test-key", stream_responses=True)
+    verse = client.generate(category="恋愛", target_date=date(2025, 1, 12))
+
+    assert verse == "すれ違う\nいつもの駅で\nまた会えた"
+    assert consumed == ["すれ違う\n", "いつもの駅で\n", "また会えた\n"]
+    assert stream.closed == [True]
+
+
+def test_http_session_retries_connects_only() -> None:
+    retry = get_http_session().get_adapter("https://api.openai.com/v1/chat/completions").max_retries
+    assert retry.connect == 2
+    assert retry.read == 0
+    assert retry.status == 0
+
+
+def test_http_session_pool_covers_concurrent_theme_requests(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app.core import config as config_module
+    from app.core.http import _create_session
+
+    settings = config_module.get_settings()
+    monkeypatch.setattr(settings, "theme_generation_category_workers", 4)
+    monkeypatch.setattr(settings, "theme_generation_parallel_attempts", 8)
+    _create_session.cache_clear()
+    try:
+        adapter = get_http_session().get_adapter("https://api.openai.com/v1/chat/completions")
+        assert adapter._pool_maxsize == 32
+    finally:
+        _create_session.cache_clear()
+
+
+def test_claude_theme_client_sends_few_shot_turns_before_user_prompt() -> None:
+    captured: dict = {}
+
+    def fake_create(**kwargs):
+        captured.update(kwargs)
+        return SimpleNamespace(content=[SimpleNamespace(type="text", text="すれちがう\nいつものえきで\nまたあえた")])
+
+    client = ClaudeThemeClient(api_key="test-key")
+    client._client = SimpleNamespace(messages=SimpleNamespace(create=fake_create))
+
+    verse = client.generate(category="恋愛", target_date=date(2025, 1, 10))
+
+    assert verse == "すれちがう\nいつものえきで\nまたあえた"
+    messages = captured["messages"]
+    assert messages[:-1] == list(THEME_FEW_SHOT_MESSAGES)
+    assert messages[-1]["role"] == "user"
+    assert isinstance(messages[-1]["content"], str)
+
+
+def test_claude_theme_client_streaming_stops_after_bad_line() -> None:
+    consumed: list[str] = []
+    streams = iter(
+        [
+            ["ながいながいいちぎょうめ\n", "いつものえきで\n", "またあえた"],
+            ["すれちがう\n", "いつものえきで\n", "またあえた"],
+        ]
+    )
+
+    class _FakeStream:
+        def __init__(self, deltas: list[str]) -> None:
+            self._deltas = deltas
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info) -> None:
+            return None
+
+        @property
+        def text_stream(self):
+            for delta in self._deltas:
+                consumed.append(delta)
+                yield delta
+
+    client = ClaudeThemeClient(api_key="test-key", stream_responses=True)
+    client._client = SimpleNamespace(messages=SimpleNamespace(stream=lambda **kwargs: _FakeStream(next(streams))))
+
+    verse = client.generate(category="恋愛", target_date=date(2025, 1, 10))
+
+    assert verse == "すれちがう\nいつものえきで\nまたあえた"
+    assert consumed == ["ながいながいいちぎょうめ\n", "すれちがう\n", "いつものえきで\n", "またあえた"]
+
+
+def test_openai_theme_client_generate_batch_returns_valid_verses(monkeypatch: pytest.MonkeyPatch) -> None:
+    themes = {"themes": {"恋愛": "すれ違う\nいつもの駅で\nまた会えた", "日常": "ながすぎるいちぎょうめ\nいつもの駅で\nまた会えた"}}
+    payload = {"choices": [{"message": {"content": orjson.dumps(themes).decode()}}]}
+    bodies: list[dict] = []
+
+    def fake_post(url, *args, **kwargs):
+        bodies.append(orjson.loads(kwargs["data"]))
+        return SimpleNamespace(status_code=200, content=orjson.dumps(payload), raise_for_status=lambda: None)
+
+    monkeypatch.setattr(get_http_session(), "post", fake_post)
+
+    client = OpenAIThemeClient(api_key="test-key")
+    verses = client.generate_batch(categories=["恋愛", "日常", "季節"], target_date=date(2025, 1, 10))
+
+    assert verses == {"恋愛": "すれ違う\nいつもの駅で\nまた会えた"}
+    assert len(bodies) == 1
+    assert bodies[0]["response_format"] == {"type": "json_object"}
+    assert "- 季節: " in bodies[0]["messages"][-1]["content"]
+
+
+def test_openai_theme_client_generate_batch_lists_history_per_category(monkeypatch: pytest.MonkeyPatch) -> None:
+    payload = {"choices": [{"message": {"content": orjson.dumps({"themes": {}}).decode()}}]}
+    bodies: list[dict] = []
+
+    def fake_post(url, *args, **kwargs):
+        bodies.append(orjson.loads(kwargs["data"]))
+        return SimpleNamespace(status_code=200, content=orjson.dumps(payload), raise_for_status=lambda: None)
+
+    monkeypatch.setattr(get_http_session(), "post", fake_post)
+
+    # More history than the prompt limit for the first category must not crowd out the second
+    past = {
+        "恋愛": [f"れんあい{index}\nいつもの駅で\nまた会えた" for index in range(40)],
+        "日常": ["寝過ごして\n電車の中で\n目が覚める"],
+    }
+    client = OpenAIThemeClient(api_key="test-key")
+    client.generate_batch(categories=["恋愛", "日常"], target_date=date(2025, 1, 10), past_themes_by_category=past)
+
+    prompt = bodies[0]["messages"][-1]["content"]
+    love_section, daily_section = prompt.split("- 日常: ")
+    assert "れんあい0 / いつもの駅で / また会えた" in love_section
+    assert "れんあい29 / " in love_section
+    assert "れんあい30 / " not in prompt
+    assert "寝過ごして / 電車の中で / 目が覚める" in daily_section
+
+
+def test_openai_theme_client_backs_off_on_rate_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    closed: list[bool] = []
+    responses = iter(
+        [
+            SimpleNamespace(status_code=429, headers={"retry-after": "2"}, close=lambda: closed.append(True)),
+            SimpleNamespace(
+                status_code=200,
+                json=lambda: {"choices": [{"message": {"content": "すれ違う\nいつもの駅で\nまた会えた"}}]},
+                content=orjson.dumps({"choices": [{"message": {"content": "すれ違う\nいつもの駅で\nまた会えた"}}]}),
+                raise_for_status=lambda: None,
+            ),
+        ]
+    )
+    sleeps: list[float] = []
+
+    monkeypatch.setattr(get_http_session(), "post", lambda *a, **k: next(responses))
+    monkeypatch.setattr("app.services.theme_ai_client.time.sleep", sleeps.append)
+
+    client = OpenAIThemeClient(api_key="test-key")
+    verse = client.generate(category="恋愛", target_date=date(2025, 1, 11))
+
+    assert verse == "すれ違う\nいつもの駅で\nまた会えた"
+    assert sleeps == [2.0]
+    assert closed == [True]  # the rate-limited response gave its connection back
+
+
+def test_openai_theme_client_does_not_retry_client_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    def raise_for_status() -> None:
+        raise requests.HTTPError("bad request")
+
+    def fake_post(url, *args, **kwargs):
+        calls.append(url)
+        return SimpleNamespace(status_code=400, headers={}, raise_for_status=raise_for_status)
+
+    monkeypatch.setattr(get_http_session(), "post", fake_post)
+    monkeypatch.setattr("app.services.theme_ai_client.time.sleep", lambda _: None)
+
+    client = OpenAIThemeClient(api_key="test-key")
+    with pytest.raises(ThemeAIClientError):
+        client.generate(category="恋愛", target_date=date(2025, 1, 11))
+    assert len(calls) == 1
+
+
+def test_openai_theme_client_closes_failed_stream(monkeypatch: pytest.MonkeyPatch) -> None:
+    closed: list[bool] = []
+
+    def raise_for_status() -> None:
+        raise requests.HTTPError("bad request")
+
+    monkeypatch.setattr(
+        get_http_session(),
+        "post",
+        lambda *args, **kwargs: SimpleNamespace(
+            status_code=400,
+            headers={},
+            raise_for_status=raise_for_status,
+            close=lambda: closed.append(True),
+        ),
+    )
+
+    client = OpenAIThemeClient(api_key="test-key", stream_responses=True)
+    with pytest.raises(ThemeAIClientError):
+        client.generate(category="恋愛", target_date=date(2025, 1, 11))
+    assert closed == [True]
+
+
 def test_resolve_theme_ai_client_requires_api_key(monkeypatch: pytest.MonkeyPatch) -> None:
     from app.core import config as config_module
 
@@ -90,10 +403,11 @@ def test_openai_theme_judge_uses_responses_api_payload(monkeypatch: pytest.Monke
             status_code=200,
             text='{"ok":true}',
             json=lambda: payload,
+            content=orjson.dumps(payload),
             raise_for_status=lambda: None,
         )
 
-    monkeypatch.setattr("app.services.theme_ai_client.requests.post", fake_post)
+    monkeypatch.setattr(get_http_session(), "post", fake_post)
 
     judge = OpenAIThemeJudge(api_key="test-key", model="gpt-5-mini", timeout=5.0)
     result = judge.choose_candidate(
@@ -171,10 +485,11 @@ def test_xai_theme_client_uses_openai_judge_selection(
         return SimpleNamespace(
             status_code=200,
             json=lambda payload=payload: payload,
+            content=orjson.dumps(payload),
             raise_for_status=lambda: None,
         )
 
-    monkeypatch.setattr("app.services.theme_ai_client.requests.post", fake_post)
+    monkeypatch.setattr(get_http_session(), "post", fake_post)
 
     client = XAIThemeClient(api_key="xai-key", timeout=5.0)
     with caplog.at_level(logging.INFO):
@@ -218,10 +533,11 @@ def test_xai_theme_client_filters_invalid_mora_before_openai_judging(
         return SimpleNamespace(
             status_code=200,
             json=lambda payload=payload: payload,
+            content=orjson.dumps(payload),
             raise_for_status=lambda: None,
         )
 
-    monkeypatch.setattr("app.services.theme_ai_client.requests.post", fake_post)
+    monkeypatch.setattr(get_http_session(), "post", fake_post)
 
     client = XAIThemeClient(api_key="xai-key", timeout=5.0)
     verse = client.generate(category="恋愛", target_date=date(2025, 1, 11))
@@ -260,10 +576,11 @@ def test_xai_theme_client_falls_back_when_openai_judge_returns_invalid_json(
         return SimpleNamespace(
             status_code=200,
             json=lambda payload=payload: payload,
+            content=orjson.dumps(payload),
             raise_for_status=lambda: None,
         )
 
-    monkeypatch.setattr("app.services.theme_ai_client.requests.post", fake_post)
+    monkeypatch.setattr(get_http_session(), "post", fake_post)
 
     client = XAIThemeClient(api_key="xai-key", timeout=5.0)
     with caplog.at_level(logging.INFO):
@@ -300,10 +617,11 @@ def test_xai_theme_client_raises_when_all_candidates_are_invalid(
         return SimpleNamespace(
             status_code=200,
             json=lambda: xai_payload,
+            content=orjson.dumps(xai_payload),
             raise_for_status=lambda: None,
         )
 
-    monkeypatch.setattr("app.services.theme_ai_client.requests.post", fake_post)
+    monkeypatch.setattr(get_http_session(), "post", fake_post)
 
     client = XAIThemeClient(api_key="xai-key", timeout=5.0)
     with pytest.raises(ThemeAIClientError):
@@ -342,10 +660,11 @@ def test_xai_theme_client_filters_out_past_theme_duplicates(
         return SimpleNamespace(
             status_code=200,
             json=lambda payload=payload: payload,
+            content=orjson.dumps(payload),
             raise_for_status=lambda: None,
         )
 
-    monkeypatch.setattr("app.services.theme_ai_client.requests.post", fake_post)
+    monkeypatch.setattr(get_http_session(), "post", fake_post)
 
     client = XAIThemeClient(api_key="xai-key", timeout=5.0)
     verse = client.generate(
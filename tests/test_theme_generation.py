@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import threading
+import time
 from contextlib import contextmanager
 from datetime import date, datetime, timezone
 from uuid import uuid4
@@ -11,7 +13,21 @@ from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
 from app.models import Theme
-from app.services.theme_generation import generate_all_categories
+from app.services import theme_generation
+from app.services.theme_generation import (
+    ThemeGenerationError,
+    clear_generated_theme_cache,
+    generate_all_categories,
+    generate_with_retry,
+)
+from tests.conftest import TestingSessionLocal
+
+
+@pytest.fixture(autouse=True)
+def _reset_generated_theme_cache():
+    clear_generated_theme_cache()
+    yield
+    clear_generated_theme_cache()
 
 
 @contextmanager
@@ -92,6 +108,37 @@ def test_generate_all_categories_inserts_new_themes(
     assert all(len(theme.text) >= 3 for theme in stored)
 
 
+def test_generate_all_categories_passes_each_category_its_past_themes(
+    db_session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    settings = get_settings()
+    monkeypatch.setattr(settings, "theme_categories", "general,emotion")
+    monkeypatch.setattr(settings, "theme_generation_max_retries", 1)
+
+    target = date(2025, 1, 6)
+    _prepare_theme(db_session, category="general", theme_date=date(2025, 1, 4), text="Older general verse")
+    _prepare_theme(db_session, category="general", theme_date=date(2025, 1, 5), text="Newer general verse")
+    _prepare_theme(db_session, category="emotion", theme_date=date(2024, 11, 1), text="Too old to matter")
+
+    seen: dict[str, list[str]] = {}
+
+    class _RecordingClient(_StaticThemeClient):
+        def generate(self, *, category, target_date, past_themes=None) -> str:
+            seen[category] = list(past_themes or [])
+            return super().generate(category=category, target_date=target_date, past_themes=past_themes)
+
+    client = _RecordingClient(
+        {
+            "general": "Gentle dawn hums across the valley",
+            "emotion": "Tender echoes linger in the heart",
+        }
+    )
+    generate_all_categories(client, target_date=target, session_factory=lambda: mock_session_factory(db_session))
+
+    assert seen == {"general": ["Newer general verse", "Older general verse"], "emotion": []}
+
+
 def test_generate_all_categories_skips_existing_ai_theme_by_default(
     db_session: Session,
     monkeypatch: pytest.MonkeyPatch,
@@ -252,3 +299,218 @@ def test_retry_run_generates_only_missing_categories(
         ("emotion", "Tender echoes linger in the heart"),
         ("general", "Gentle dawn hums across the valley"),
     ]
+
+
+class _CountingThemeClient:
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.calls = 0
+
+    def generate(
+        self,
+        *,
+        category: str,
+        target_date: date,
+        past_themes: list[str] | None = None,
+    ) -> str:
+        self.calls += 1
+        return self.text
+
+
+def test_generate_with_retry_reuses_cached_theme_for_same_slot() -> None:
+    client = _CountingThemeClient("Gentle dawn hums across the valley")
+    target = date(2025, 1, 20)
+
+    first = generate_with_retry(client, category="general", target_date=target)
+    second = generate_with_retry(client, category="general", target_date=target)
+    assert first == second
+    assert client.calls == 1
+
+    generate_with_retry(client, category="general", target_date=target, use_cache=False)
+    assert client.calls == 2
+
+
+def test_generate_with_retry_backs_off_exponentially(monkeypatch: pytest.MonkeyPatch) -> None:
+    settings = get_settings()
+    monkeypatch.setattr(settings, "theme_generation_max_retries", 3)
+    monkeypatch.setattr(settings, "theme_generation_retry_delay_seconds", 2.0)
+    sleeps: list[float] = []
+    monkeypatch.setattr("app.services.theme_generation.time.sleep", sleeps.append)
+    monkeypatch.setattr("app.services.theme_generation.random.uniform", lambda low, high: 1.0)
+
+    client = _CountingThemeClient("x")  # too short, so every attempt is rejected
+    with pytest.raises(ThemeGenerationError):
+        generate_with_retry(client, category="general", target_date=date(2025, 1, 21))
+
+    assert sleeps == [2.0, 4.0]
+
+
+def test_generate_with_retry_cache_is_per_model() -> None:
+    first = _CountingThemeClient("Gentle dawn hums across the valley")
+    first.model = "model-a"
+    second = _CountingThemeClient("Tender echoes linger in the heart")
+    second.model = "model-b"
+    target = date(2025, 1, 22)
+
+    generate_with_retry(first, category="general", target_date=target)
+    text = generate_with_retry(second, category="general", target_date=target)
+
+    assert text == "Tender echoes linger in the heart"
+    assert second.calls == 1
+
+
+def test_generate_with_retry_ignores_cached_theme_that_became_duplicate() -> None:
+    client = _CountingThemeClient("Gentle dawn hums across the valley")
+    target = date(2025, 1, 21)
+
+    generate_with_retry(client, category="general", target_date=target)
+    client.text = "Tender echoes linger in the heart"
+    text = generate_with_retry(
+        client,
+        category="general",
+        target_date=target,
+        past_themes=["Gentle dawn hums across the valley"],
+    )
+
+    assert text == "Tender echoes linger in the heart"
+    assert client.calls == 2
+
+
+def test_generate_all_categories_uses_batched_verses_when_enabled(
+    db_session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    settings = get_settings()
+    monkeypatch.setattr(settings, "theme_categories", "general,emotion")
+    monkeypatch.setattr(settings, "theme_generation_max_retries", 1)
+    monkeypatch.setattr(settings, "theme_generation_batch_categories", True)
+
+    class _BatchClient(_CountingThemeClient):
+        def __init__(self) -> None:
+            super().__init__("Tender echoes linger in the heart")
+            self.batches: list[list[str]] = []
+            self.histories: list[dict[str, list[str]]] = []
+
+        def generate_batch(self, *, categories, target_date, past_themes_by_category=None) -> dict[str, str]:
+            self.batches.append(list(categories))
+            self.histories.append({category: list(past_themes_by_category[category]) for category in categories})
+            return {"general": "Gentle dawn hums across the valley"}
+
+    client = _BatchClient()
+    target = date(2025, 1, 23)
+    _prepare_theme(db_session, category="general", theme_date=date(2025, 1, 21), text="Earlier general verse")
+    _prepare_theme(db_session, category="emotion", theme_date=date(2025, 1, 22), text="Earlier emotion verse")
+    batch = generate_all_categories(
+        client,
+        target_date=target,
+        session_factory=lambda: mock_session_factory(db_session),
+    )
+
+    # The miss is retried once as a smaller batch before falling back
+    assert client.batches == [["general", "emotion"], ["emotion"]]
+    # Every category in a batch carries its own history, not a shared truncated list
+    assert client.histories == [
+        {"general": ["Earlier general verse"], "emotion": ["Earlier emotion verse"]},
+        {"emotion": ["Earlier emotion verse"]},
+    ]
+    assert client.calls == 1  # only the category both batches missed
+    assert {result.category: result.generated_text for result in batch.results} == {
+        "general": "Gentle dawn hums across the valley",
+        "emotion": "Tender echoes linger in the heart",
+    }
+
+
+@contextmanager
+def _fresh_session():
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def test_generate_all_categories_runs_categories_concurrently(
+    db_session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    settings = get_settings()
+    monkeypatch.setattr(settings, "theme_categories", "general,emotion")
+    monkeypatch.setattr(settings, "theme_generation_max_retries", 1)
+    monkeypatch.setattr(settings, "theme_generation_category_workers", 2)
+
+    # Both categories must be in generate() at once to get past the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    class _ConcurrentClient(_StaticThemeClient):
+        def generate(self, *, category, target_date, past_themes=None) -> str:
+            barrier.wait()
+            return super().generate(category=category, target_date=target_date, past_themes=past_themes)
+
+    client = _ConcurrentClient(
+        {
+            "general": "Gentle dawn hums across the valley",
+            "emotion": "Tender echoes linger in the heart",
+        }
+    )
+    target = date(2025, 1, 24)
+    batch = generate_all_categories(client, target_date=target, session_factory=_fresh_session)
+
+    assert [result.category for result in batch.results] == ["general", "emotion"]
+    assert batch.failed_categories == []
+    stored = db_session.query(Theme).filter(Theme.date == target).all()
+    assert {theme.category for theme in stored} == {"general", "emotion"}
+
+
+def test_concurrent_runs_for_same_slot_share_one_generation(monkeypatch: pytest.MonkeyPatch) -> None:
+    settings = get_settings()
+    monkeypatch.setattr(settings, "theme_categories", "general")
+    monkeypatch.setattr(settings, "theme_generation_max_retries", 1)
+
+    target = date(2025, 1, 25)
+    entered = threading.Event()
+    release = threading.Event()
+    calls: list[str] = []
+
+    class _BlockingClient:
+        def __init__(self, model: str) -> None:
+            # Different models so the second run cannot just reuse the cached text
+            self.model = model
+
+        def generate(self, *, category, target_date, past_themes=None) -> str:
+            calls.append(self.model)
+            entered.set()
+            assert release.wait(timeout=5)
+            return f"Gentle dawn hums across the {self.model}"
+
+    batches: dict[str, object] = {}
+
+    def run(name: str) -> None:
+        batches[name] = generate_all_categories(
+            _BlockingClient(name), target_date=target, session_factory=_fresh_session
+        )
+
+    first = threading.Thread(target=run, args=("first",))
+    first.start()
+    assert entered.wait(timeout=5)
+    second = threading.Thread(target=run, args=("second",))
+    second.start()
+    # Let the first run finish only once the second is queued on the slot lock
+    for _ in range(500):
+        with theme_generation._GENERATION_LOCKS_GUARD:
+            slot_lock = theme_generation._GENERATION_LOCKS.get(("general", target))
+            if slot_lock is not None and slot_lock.users == 2:
+                break
+        time.sleep(0.01)
+    release.set()
+    first.join(timeout=5)
+    second.join(timeout=5)
+
+    assert calls == ["first"]
+    assert [result.generated_text for result in batches["first"].results] == ["Gentle dawn hums across the first"]
+    assert batches["second"].results == []
+    assert batches["second"].skipped_categories == ["general"]
+    assert batches["second"].missing_categories == []
+    with _fresh_session() as session:
+        stored = session.query(Theme).filter(Theme.date == target).all()
+    assert [theme.text for theme in stored] == ["Gentle dawn hums across the first"]
+    assert theme_generation._GENERATION_LOCKS == {}